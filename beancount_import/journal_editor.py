@@ -19,7 +19,7 @@ journal, and modifies only the lines occupied by the directives explicitly
 included in the change set.
 """
 
-from typing import Union, Dict, Tuple, List, Optional, Set, NamedTuple, Sequence, FrozenSet, Iterable
+from typing import Any, Union, Dict, Tuple, List, Optional, Set, NamedTuple, Sequence, FrozenSet, Iterable
 import datetime
 import collections
 import contextlib
@@ -292,6 +292,9 @@ class JournalEditor(object):
         self.ignored_journal_filenames = set(
             os.path.realpath(x) for x in ignored_journal_paths)
         self._all_entries = None  # type: Optional[Entries]
+        # Memoized results of get_postings_by_ref, keyed by metadata key.
+        # Reset whenever the entries change.
+        self._ref_index = {}  # type: Dict[str, Dict[Any, List[Tuple[Transaction, Posting]]]]
 
     @property
     def all_entries(self) -> Entries:
@@ -300,6 +303,32 @@ class JournalEditor(object):
             self._all_entries.extend(self.ignored_entries)
         return self._all_entries
 
+    def get_postings_by_ref(
+            self, key: str) -> Dict[Any, List[Tuple[Transaction, Posting]]]:
+        """Returns the postings carrying `key` metadata, grouped by its value.
+
+        The result maps each metadata value to the (entry, posting) pairs that
+        carry it, in journal order.  It is computed with a single pass over
+        all_entries per key and shared by all sources until the journal
+        changes, so it must not be modified; callers filter it by their own
+        accounts.
+        """
+        index = self._ref_index.get(key)
+        if index is None:
+            index = {}
+            for entry in self.all_entries:
+                if not isinstance(entry, Transaction):
+                    continue
+                for posting in entry.postings:
+                    meta = posting.meta
+                    if meta is None:
+                        continue
+                    ref = meta.get(key)
+                    if ref is not None:
+                        index.setdefault(ref, []).append((entry, posting))
+            self._ref_index[key] = index
+        return index
+
     def get_journal_lines(self, filename: str):
         filename = os.path.realpath(filename)
         if filename in self.cached_lines:
@@ -511,6 +540,7 @@ class JournalEditor(object):
         self.entries.sort(key=beancount.core.data.entry_sortkey)
         self.ignored_entries.sort(key=beancount.core.data.entry_sortkey)
         self._all_entries = None
+        self._ref_index = {}
         return ApplyStagedChangesResult(
             old_entries=[
                 e for e in old_entries
@@ -336,6 +336,37 @@ def test_remove(tmpdir):
     check_journal_entries(editor)
 
 
+def test_get_postings_by_ref(tmpdir):
+    journal_path = create_journal(
+        tmpdir, """
+2015-01-01 * "Test transaction 1"
+  Assets:Account-A  100 USD
+    source_ref: "mt940:a"
+  Assets:Account-B
+    source_ref: "other:b"
+
+2015-02-01 * "Test transaction 2"
+  Assets:Account-A  100 USD
+    source_ref: "mt940:a"
+  Assets:Account-B
+""")
+    editor = journal_editor.JournalEditor(journal_path)
+    index = editor.get_postings_by_ref('source_ref')
+    assert list(index) == ['mt940:a', 'other:b']
+    assert [entry.narration for entry, _ in index['mt940:a']] == [
+        'Test transaction 1', 'Test transaction 2'
+    ]
+    assert editor.get_postings_by_ref('source_ref') is index
+
+    stage = editor.stage_changes()
+    stage.remove_entry(editor.entries[0])
+    stage.apply()
+    index = editor.get_postings_by_ref('source_ref')
+    assert [entry.narration for entry, _ in index['mt940:a']] == [
+        'Test transaction 2'
+    ]
+
+
 def test_add(tmpdir):
     journal_path = create_journal(
         tmpdir, """
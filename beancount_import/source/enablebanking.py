@@ -53,13 +53,22 @@ is used to match transactions and avoid duplicates.
 
 import collections
 import datetime
+import enum
+import functools
 import hashlib
 import json
 import os
 import re
+import types
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+orjson: Optional[types.ModuleType]
+try:
+    import orjson
+except ImportError:  # Optional: faster parsing of large transactions files
+    orjson = None
 
 from beancount.core.data import Balance, Document, Posting, Transaction, EMPTY_SET
 from beancount.core.flags import FLAG_OKAY
@@ -69,7 +78,10 @@ from beancount.core.amount import Amount
 from . import ImportResult, Source, SourceResults, InvalidSourceReference
 from ..matching import FIXME_ACCOUNT
 from ..journal_editor import JournalEditor
-from .enablebanking_rules import get_parsed_transaction, KNOWN_TRANSACTION_TYPES
+from .parse_helpers import DATACLASS_SLOTS, intern_string
+from .enablebanking_rules import (
+    get_parsed_transaction, parse_many, KNOWN_TRANSACTION_TYPES, ParsedTransaction,
+)
 
 
 # Metadata keys (standardized across all bank sources)
@@ -86,6 +98,13 @@ TRANSACTION_DATE_KEY = 'transaction_date'  # Value/transaction date (when money
 SOURCE_DOC_KEY = 'document'  # Link to source document file (clickable in fava)
 BOOKING_DATE_KEY = 'booking_date'  # Booking date (when bank recorded it)
 
+# Separator between a counterparty name and an embedded address (3+ spaces).
+_ADDR_SPLIT_RE = re.compile(r'\s{3,}')
+
+# Shared read-only stand-in for missing nested JSON objects, so transactions
+# without e.g. a creditor don't allocate an empty dict each.
+_EMPTY_OBJECT: Mapping[str, Any] = types.MappingProxyType({})
+
 
 
 
@@ -100,7 +119,6 @@ def _split_counterparty_address(name: Optional[str]) -> Tuple[Optional[str], Opt
     
     Returns: (name, address) tuple. Address is None if no separator found.
     """
-    import re
     if not name:
         return None, None
     
@@ -110,7 +128,7 @@ def _split_counterparty_address(name: Optional[str]) -> Tuple[Optional[str], Opt
         return parts[0].strip(), parts[1].strip()
     
     # Try multiple spaces (3 or more) as separator
-    parts = re.split(r'\s{3,}', name, maxsplit=1)
+    parts = _ADDR_SPLIT_RE.split(name, maxsplit=1)
     if len(parts) == 2:
         return parts[0].strip(), parts[1].strip()
     
@@ -128,7 +146,7 @@ class EnableBankingAccount:
     account_id: str  # IBAN_CURRENCY format for file matching
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnableBankingTransaction:
     """Transaction from EnableBanking."""
     entry_reference: str
@@ -168,16 +186,32 @@ def _parse_decimal(value: Optional[str]) -> Optional[Decimal]:
         return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> datetime.date:
+    # Exports repeat the same few hundred dates across booking, value and
+    # transaction dates, so parsed dates are shared.
+    return datetime.date.fromisoformat(value)
+
+
 def _parse_date(value: Optional[str]) -> Optional[datetime.date]:
     """Parse ISO date string."""
     if not value:
         return None
     try:
-        return datetime.date.fromisoformat(value[:10])
+        return _parse_iso_date(value[:10])
     except (ValueError, TypeError):
         return None
 
 
+def _load_json(path: str):
+    """Load a JSON file, using orjson when it is available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def _extract_account_iban(account_id_obj: Optional[dict]) -> Optional[str]:
     """Extract IBAN from account_id object."""
     if not account_id_obj:
@@ -202,7 +236,7 @@ def _extract_address(postal_address: Optional[dict]) -> Optional[str]:
     """
     if not postal_address:
         return None
-    address_lines = postal_address.get('address_line') or []
+    address_lines = postal_address.get('address_line') or ()
     if not address_lines:
         return None
     # Clean up each line and join with comma
@@ -223,7 +257,7 @@ def _parse_transaction(txn_data: dict, account_id: str, bank: str, source_filena
         return None
     
     # Parse amount
-    amount_obj = txn_data.get('transaction_amount', {})
+    amount_obj = txn_data.get('transaction_amount') or _EMPTY_OBJECT
     amount_str = amount_obj.get('amount')
     currency = amount_obj.get('currency', 'PLN')
     
@@ -254,14 +288,14 @@ def _parse_transaction(txn_data: dict, account_id: str, bank: str, source_filena
     value_date = _parse_date(txn_data.get('value_date'))
     
     # Creditor info
-    creditor = txn_data.get('creditor') or {}
+    creditor = txn_data.get('creditor') or _EMPTY_OBJECT
     creditor_name = creditor.get('name')
     creditor_acc = txn_data.get('creditor_account')
     creditor_iban = _extract_account_iban(creditor_acc) if creditor_acc else None
     creditor_address = _extract_address(creditor.get('postal_address'))
     
     # Debtor info
-    debtor = txn_data.get('debtor') or {}
+    debtor = txn_data.get('debtor') or _EMPTY_OBJECT
     debtor_name = debtor.get('name')
     debtor_acc = txn_data.get('debtor_account')
     debtor_iban = _extract_account_iban(debtor_acc) if debtor_acc else None
@@ -272,11 +306,11 @@ def _parse_transaction(txn_data: dict, account_id: str, bank: str, source_filena
     if isinstance(remittance, str):
         remittance = [remittance]
     
-    # Bank transaction code
+    # Bank transaction code (compared against KNOWN_TRANSACTION_TYPES)
     bank_txn_code_obj = txn_data.get('bank_transaction_code')
     bank_txn_code = None
     if bank_txn_code_obj and isinstance(bank_txn_code_obj, dict):
-        bank_txn_code = bank_txn_code_obj.get('code')
+        bank_txn_code = intern_string(bank_txn_code_obj.get('code'))
     
     # Balance after transaction
     balance_obj = txn_data.get('balance_after_transaction')
@@ -287,12 +321,12 @@ def _parse_transaction(txn_data: dict, account_id: str, bank: str, source_filena
     return EnableBankingTransaction(
         entry_reference=entry_ref,
         amount=amount,
-        currency=currency,
-        credit_debit_indicator=indicator,
+        currency=intern_string(currency),
+        credit_debit_indicator=intern_string(indicator),
         booking_date=booking_date,
         transaction_date=transaction_date,
         value_date=value_date,
-        status=txn_data.get('status', 'BOOK'),
+        status=intern_string(txn_data.get('status', 'BOOK')),
         creditor_name=creditor_name,
         creditor_iban=creditor_iban,
         creditor_address=creditor_address,
@@ -303,7 +337,7 @@ def _parse_transaction(txn_data: dict, account_id: str, bank: str, source_filena
         bank_transaction_code=bank_txn_code,
         balance_after=balance_after,
         account_id=account_id,
-        bank=bank,
+        bank=intern_string(bank),
         source_filename=source_filename,
     )
 
@@ -329,6 +363,14 @@ def get_info(txn: EnableBankingTransaction) -> dict:
 _BANKS_NOT_SET = object()  # Sentinel to distinguish "banks not specified" from "banks: null"
 
 
+class _NotParsed(enum.Enum):
+    """Sentinel type for "rules not applied yet" (None means no rule matched)."""
+    NOT_PARSED = enum.auto()
+
+
+_NOT_PARSED = _NotParsed.NOT_PARSED
+
+
 class EnableBankingSource(Source):
     """EnableBanking JSON transaction source."""
 
@@ -432,8 +474,7 @@ class EnableBankingSource(Source):
     def _load_accounts(self, path: str, bank_name: str) -> None:
         """Load accounts from accounts.json file."""
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(path)
         except Exception as e:
             self.log_status(f'enablebanking: error loading {path}: {e}')
             return
@@ -461,8 +502,7 @@ class EnableBankingSource(Source):
     def _load_transactions(self, path: str, account_id: str, bank_name: str) -> None:
         """Load transactions from a transactions_*.json file."""
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(path)
         except Exception as e:
             self.log_status(f'enablebanking: error loading {path}: {e}')
             return
@@ -480,7 +520,12 @@ class EnableBankingSource(Source):
         source_filename = path
         self._loaded_files.append((account_id, source_filename))
         
-        for txn_data in data.get('transactions', []):
+        # Release each raw transaction dict once converted, so large files
+        # don't hold the whole JSON tree and all parsed transactions at once
+        raw_txns = data.get('transactions', [])
+        del data
+        for i, txn_data in enumerate(raw_txns):
+            raw_txns[i] = None
             txn = _parse_transaction(txn_data, account_id, actual_bank, source_filename)
             if txn:
                 self.transactions.append(txn)
@@ -539,56 +584,53 @@ class EnableBankingSource(Source):
         """Prepare import results from loaded transactions."""
         all_accounts = self._get_all_accounts()
 
-        # Build set of already-matched transaction IDs
+        # Already-matched transaction IDs in our accounts.  The journal-wide
+        # ref index is built once and shared with other sources.
         matched_ids: Dict[str, List[Tuple[Transaction, Posting]]] = {}
-
-        for entry in journal.all_entries:
-            if isinstance(entry, Transaction):
-                for posting in entry.postings:
-                    if posting.meta is None:
-                        continue
-                    if posting.account not in all_accounts:
-                        continue
-                    ref = posting.meta.get(SOURCE_REF_KEY)
-                    if ref is not None:
-                        matched_ids.setdefault(ref, []).append((entry, posting))
+        for ref, pairs in journal.get_postings_by_ref(SOURCE_REF_KEY).items():
+            ours = [pair for pair in pairs if pair[1].account in all_accounts]
+            if ours:
+                matched_ids[ref] = ours
 
         # Group transactions by account for balance assertions
         txns_by_account: Dict[str, List[EnableBankingTransaction]] = {}
         
         # Process all transactions
         valid_ids = set()
+        new_txns: List[Tuple[EnableBankingTransaction, str]] = []
         for txn in self.transactions:
             txn_id = _generate_transaction_id(txn)
             valid_ids.add(txn_id)
 
+            target_account = self._get_account_for_id(txn.account_id)
             existing = matched_ids.get(txn_id)
             if existing is not None:
                 if len(existing) > 1:
                     results.add_invalid_reference(
                         InvalidSourceReference(len(existing) - 1, existing))
-            else:
-                # Create new transaction
-                target_account = self._get_account_for_id(txn.account_id)
-                # Skip if account is not mapped and no default_account
-                if target_account is None:
-                    continue
-                beancount_txn = self._make_transaction(txn, target_account)
-                results.add_pending_entry(
-                    ImportResult(
-                        date=txn.booking_date,
-                        entries=[beancount_txn],
-                        info=get_info(txn),
-                    ))
+            elif target_account is not None:
+                # New transaction (skipped if account is not mapped and no
+                # default_account)
+                new_txns.append((txn, target_account))
             
             # Track for balance assertions (only for mapped accounts)
-            target_account = self._get_account_for_id(txn.account_id)
             if target_account is None:
                 continue
             if txn.account_id not in txns_by_account:
                 txns_by_account[txn.account_id] = []
             txns_by_account[txn.account_id].append(txn)
 
+        # Apply parsing rules to all new transactions in one batch
+        parsed_list = parse_many([txn for txn, _ in new_txns])
+        for (txn, target_account), parsed in zip(new_txns, parsed_list):
+            beancount_txn = self._make_transaction(txn, target_account, parsed)
+            results.add_pending_entry(
+                ImportResult(
+                    date=txn.booking_date,
+                    entries=[beancount_txn],
+                    info=get_info(txn),
+                ))
+
         # Generate monthly balance assertions from transactions with balance_after
         # For each account, group transactions by month and generate balance at end of each month
         # Only generate for completed months (not the current month)
@@ -718,8 +760,16 @@ class EnableBankingSource(Source):
         self, 
         txn: EnableBankingTransaction, 
         target_account: str,
+        parsed: Union[Optional[ParsedTransaction], _NotParsed] = _NOT_PARSED,
     ) -> Transaction:
-        """Create a Beancount Transaction from an EnableBanking transaction."""
+        """Create a Beancount Transaction from an EnableBanking transaction.
+
+        Args:
+            txn: The transaction to convert.
+            target_account: Beancount account for the bank posting.
+            parsed: Result of the parsing rules for `txn`, if already
+                    computed (e.g. by parse_many). Computed here if omitted.
+        """
         txn_id = _generate_transaction_id(txn)
 
         # Build metadata
@@ -804,7 +854,8 @@ class EnableBankingSource(Source):
 
         # Determine payee, narration, and transaction_type
         # First try bank-specific and generic rules
-        parsed = get_parsed_transaction(txn)
+        if parsed is _NOT_PARSED:
+            parsed = get_parsed_transaction(txn)
         if parsed:
             payee = parsed.payee
             narration = parsed.narration
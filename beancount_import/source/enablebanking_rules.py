@@ -12,14 +12,22 @@ When counterparty is available: counterparty -> payee, title -> narration
 When counterparty is NOT available: title -> payee, type -> narration
 """
 
+import collections
+import re
+import sys
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .enablebanking import EnableBankingTransaction
 
+from .parse_helpers import DATACLASS_SLOTS
 
-@dataclass
+# Separator between a counterparty name and an embedded address (3+ spaces).
+_ADDR_SPLIT_RE = re.compile(r'\s{3,}')
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ParsedTransaction:
     """Result of parsing transaction data.
     
@@ -33,35 +41,63 @@ class ParsedTransaction:
     transaction_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
+class RuleContext:
+    """Per-transaction values shared by all rules.
+
+    Computed once per transaction by the dispatcher so that rules do not
+    recompute them in both `condition` and `extract`.
+
+    Attributes:
+        txn: The transaction being parsed
+        counterparty: Counterparty name (see _get_counterparty)
+        n_lines: Number of remittance_information lines
+        btc: The bank_transaction_code
+    """
+    txn: 'EnableBankingTransaction'
+    counterparty: Optional[str]
+    n_lines: int
+    btc: Optional[str]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class BankRule:
     """A single parsing rule for a bank.
     
     Attributes:
         name: Human-readable name for this rule (for debugging/logging)
         condition: Function that returns True if this rule should be applied
-        extract: Function that extracts payee/narration/type from the transaction
+        extract: Function that extracts payee/narration/type from the rule context
+        n_lines: If set, the rule only applies to transactions with exactly
+            this many remittance_information lines
+        min_remittance_lines: The rule only applies to transactions with at
+            least this many remittance_information lines
+        btc_in: If set, the rule only applies when bank_transaction_code is
+            one of these values
+
+    The optional fields are declarative preconditions used by RuleIndex to
+    skip rules that cannot match; `condition` is still evaluated on the
+    remaining candidates. `condition` and `extract` may rely on these
+    preconditions (e.g. index remittance_information without a length
+    check) but must not raise otherwise.
     """
     name: str
-    condition: Callable[['EnableBankingTransaction'], bool]
-    extract: Callable[['EnableBankingTransaction'], ParsedTransaction]
+    condition: Callable[[RuleContext], bool]
+    extract: Callable[[RuleContext], ParsedTransaction]
+    n_lines: Optional[int] = None
+    min_remittance_lines: int = 0
+    btc_in: Optional[Tuple[str, ...]] = None
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def _has_two_remittance_lines(txn: 'EnableBankingTransaction') -> bool:
-    """Check if transaction has exactly 2 remittance information lines."""
-    return len(txn.remittance_information) == 2
-
-
 def _get_counterparty(txn: 'EnableBankingTransaction') -> Optional[str]:
     """Get counterparty name based on credit/debit indicator.
     
     Also splits off address if embedded in name (comma or multiple spaces).
     """
-    import re
     name = txn.debtor_name if txn.credit_debit_indicator == 'CRDT' else txn.creditor_name
     if not name:
         return None
@@ -69,35 +105,39 @@ def _get_counterparty(txn: 'EnableBankingTransaction') -> Optional[str]:
     if ',' in name:
         name = name.split(',', 1)[0].strip()
     else:
-        parts = re.split(r'\s{3,}', name, maxsplit=1)
+        parts = _ADDR_SPLIT_RE.split(name, maxsplit=1)
         if len(parts) >= 1:
             name = parts[0].strip()
     return name or None
 
 
-def _get_title_and_type(txn: 'EnableBankingTransaction') -> tuple:
+def _get_title_and_type(txn: 'EnableBankingTransaction') -> Tuple[Optional[str], Optional[str]]:
     """Extract title and type from remittance_information.
     
     Returns:
         (title, transaction_type) tuple
         transaction_type is only returned if it's in KNOWN_TRANSACTION_TYPES
     """
-    if len(txn.remittance_information) >= 2:
-        title = txn.remittance_information[0]
-        raw_type = txn.remittance_information[1]
+    remittance = txn.remittance_information
+    n_lines = len(remittance)
+    if n_lines >= 2:
+        title = remittance[0]
+        raw_type = remittance[1]
         # Only use as transaction_type if it's a known type
         if raw_type in KNOWN_TRANSACTION_TYPES:
             return title, raw_type
         else:
             return title, None
-    elif len(txn.remittance_information) == 1:
-        return txn.remittance_information[0], None
+    elif n_lines == 1:
+        return remittance[0], None
     return None, None
 
 
 # Known transaction types - closed catalog
 # Only these values should be used as transaction_type
-KNOWN_TRANSACTION_TYPES = {
+# Interned so that membership tests against interned bank transaction codes
+# (see enablebanking._parse_transaction) hit the identity fast path.
+KNOWN_TRANSACTION_TYPES = frozenset(map(sys.intern, {
     # mBank types
     'BLIK',
     'PRZELEW',
@@ -132,77 +172,128 @@ KNOWN_TRANSACTION_TYPES = {
     'PRZELEW KRAJOWY',
     'PRZELEW ZAGRANICZNY',
     'OPERACJA KARTĄ',
-}
+}))
 
 
 # =============================================================================
 # GENERIC RULES (apply to all banks)
 # =============================================================================
 
-def _get_transaction_type_if_known(value: str) -> str:
+def _get_transaction_type_if_known(value: Optional[str]) -> Optional[str]:
     """Return value only if it's a known transaction type, otherwise None."""
     return value if value in KNOWN_TRANSACTION_TYPES else None
 
 
-GENERIC_RULES: List[BankRule] = [
-    # Generic rule: 2 remittance lines with counterparty
-    # counterparty -> payee, first line -> narration, second line -> type (if known)
+# Generic rule: 2 remittance lines with counterparty
+# counterparty -> payee, first line -> narration, second line -> type (if known)
+
+def _rule_generic_two_lines_with_counterparty_condition(ctx: RuleContext) -> bool:
+    return ctx.n_lines == 2 and ctx.counterparty is not None
+
+
+def _rule_generic_two_lines_with_counterparty_extract(ctx: RuleContext) -> ParsedTransaction:
+    assert ctx.counterparty is not None  # Checked by condition
+    return ParsedTransaction(
+        payee=ctx.counterparty,
+        narration=ctx.txn.remittance_information[0],
+        transaction_type=_get_transaction_type_if_known(ctx.txn.remittance_information[1])
+    )
+
+
+# Generic rule: 2 remittance lines WITHOUT counterparty
+# first line -> payee, second line -> narration
+# transaction_type only if second line is a known type
+
+def _rule_generic_two_lines_no_counterparty_condition(ctx: RuleContext) -> bool:
+    return ctx.n_lines == 2 and ctx.counterparty is None
+
+
+def _rule_generic_two_lines_no_counterparty_extract(ctx: RuleContext) -> ParsedTransaction:
+    return ParsedTransaction(
+        payee=ctx.txn.remittance_information[0],
+        narration=ctx.txn.remittance_information[1],
+        transaction_type=_get_transaction_type_if_known(ctx.txn.remittance_information[1])
+    )
+
+
+# Generic rule: 1 remittance line
+# counterparty (if exists) or bank -> payee, remittance line -> narration
+# NO transaction_type - single line is typically a title, not a type
+
+def _rule_generic_single_line_condition(ctx: RuleContext) -> bool:
+    return ctx.n_lines == 1
+
+
+def _rule_generic_single_line_extract(ctx: RuleContext) -> ParsedTransaction:
+    return ParsedTransaction(
+        payee=ctx.counterparty or ctx.txn.bank,
+        narration=ctx.txn.remittance_information[0],
+        transaction_type=_get_transaction_type_if_known(ctx.txn.remittance_information[0])
+    )
+
+
+# Generic rule: counterparty exists but no remittance (Pekao card payments)
+
+def _rule_generic_counterparty_only_condition(ctx: RuleContext) -> bool:
+    return ctx.n_lines == 0 and ctx.counterparty is not None
+
+
+def _rule_generic_counterparty_only_extract(ctx: RuleContext) -> ParsedTransaction:
+    assert ctx.counterparty is not None  # Checked by condition
+    return ParsedTransaction(
+        payee=ctx.counterparty,
+        narration=ctx.btc or 'Transaction',
+        transaction_type=_get_transaction_type_if_known(ctx.btc)
+    )
+
+
+GENERIC_RULES: Tuple[BankRule, ...] = (
     BankRule(
         name='generic_two_lines_with_counterparty',
-        condition=lambda txn: (
-            _has_two_remittance_lines(txn)
-            and _get_counterparty(txn) is not None
-        ),
-        extract=lambda txn: ParsedTransaction(
-            payee=_get_counterparty(txn),
-            narration=txn.remittance_information[0],
-            transaction_type=_get_transaction_type_if_known(txn.remittance_information[1])
-        )
+        n_lines=2,
+        condition=_rule_generic_two_lines_with_counterparty_condition,
+        extract=_rule_generic_two_lines_with_counterparty_extract,
     ),
-    
-    # Generic rule: 2 remittance lines WITHOUT counterparty
-    # first line -> payee, second line -> narration
-    # transaction_type only if second line is a known type
     BankRule(
         name='generic_two_lines_no_counterparty',
-        condition=lambda txn: (
-            _has_two_remittance_lines(txn)
-            and _get_counterparty(txn) is None
-        ),
-        extract=lambda txn: ParsedTransaction(
-            payee=txn.remittance_information[0],
-            narration=txn.remittance_information[1],
-            transaction_type=_get_transaction_type_if_known(txn.remittance_information[1])
-        )
+        n_lines=2,
+        condition=_rule_generic_two_lines_no_counterparty_condition,
+        extract=_rule_generic_two_lines_no_counterparty_extract,
     ),
-    
-    # Generic rule: 1 remittance line
-    # counterparty (if exists) or bank -> payee, remittance line -> narration
-    # NO transaction_type - single line is typically a title, not a type
     BankRule(
         name='generic_single_line',
-        condition=lambda txn: len(txn.remittance_information) == 1,
-        extract=lambda txn: ParsedTransaction(
-            payee=_get_counterparty(txn) or txn.bank,
-            narration=txn.remittance_information[0],
-            transaction_type=_get_transaction_type_if_known(txn.remittance_information[0])
-        )
+        n_lines=1,
+        condition=_rule_generic_single_line_condition,
+        extract=_rule_generic_single_line_extract,
     ),
-    
-    # Generic rule: counterparty exists but no remittance (Pekao card payments)
     BankRule(
         name='generic_counterparty_only',
-        condition=lambda txn: (
-            len(txn.remittance_information) == 0
-            and _get_counterparty(txn) is not None
-        ),
-        extract=lambda txn: ParsedTransaction(
-            payee=_get_counterparty(txn),
-            narration=txn.bank_transaction_code or 'Transaction',
-            transaction_type=_get_transaction_type_if_known(txn.bank_transaction_code) if txn.bank_transaction_code else None
-        )
+        n_lines=0,
+        condition=_rule_generic_counterparty_only_condition,
+        extract=_rule_generic_counterparty_only_extract,
     ),
-]
+)
+
+
+# GENERIC_RULES describes the generic rules for introspection; dispatch uses
+# _apply_generic, which evaluates them as a single decision tree.
+
+def _apply_generic(ctx: RuleContext) -> Optional[ParsedTransaction]:
+    """Apply the generic rules.
+
+    Equivalent to evaluating GENERIC_RULES in order: the rules are disjoint
+    on (n_lines, counterparty), so the matching one is selected directly.
+    """
+    n_lines = ctx.n_lines
+    if n_lines == 2:
+        if ctx.counterparty is not None:
+            return _rule_generic_two_lines_with_counterparty_extract(ctx)
+        return _rule_generic_two_lines_no_counterparty_extract(ctx)
+    if n_lines == 1:
+        return _rule_generic_single_line_extract(ctx)
+    if n_lines == 0 and ctx.counterparty is not None:
+        return _rule_generic_counterparty_only_extract(ctx)
+    return None
 
 
 # =============================================================================
@@ -211,46 +302,198 @@ GENERIC_RULES: List[BankRule] = [
 # These override generic rules for specific banks.
 # Rules are evaluated in order - first match wins.
 
-BANK_RULES: Dict[str, List[BankRule]] = {
+# Revolut: card payments with bank_transaction_code
+
+_REVOLUT_CARD_BTCS = frozenset({sys.intern('CARD_PAYMENT'), sys.intern('OTP_PAYMENT')})
+
+
+def _rule_revolut_card_payment_condition(ctx: RuleContext) -> bool:
+    return ctx.btc in _REVOLUT_CARD_BTCS
+
+
+def _rule_revolut_card_payment_extract(ctx: RuleContext) -> ParsedTransaction:
+    return ParsedTransaction(
+        payee=ctx.txn.remittance_information[0],
+        narration=ctx.btc or 'Card payment',
+        transaction_type=ctx.btc
+    )
+
+
+BANK_RULES: Dict[str, Tuple[BankRule, ...]] = {
     
     # -------------------------------------------------------------------------
     # mBank - has specific patterns in remittance_information
     # -------------------------------------------------------------------------
-    'mbank': [
+    'mbank': (
         # No special mbank-only rules needed - generic rules handle all cases
         # The pattern is:
         # - [title, type] with counterparty -> counterparty=payee, title=narration, type=transaction_type
         # - [title, type] without counterparty -> title=payee, type=narration (also transaction_type)
-    ],
+    ),
     
     # -------------------------------------------------------------------------
     # Revolut - uses bank_transaction_code
     # -------------------------------------------------------------------------
-    'Revolut': [
-        # Card payments with bank_transaction_code
+    'Revolut': (
         BankRule(
             name='card_payment',
-            condition=lambda txn: (
-                txn.bank_transaction_code in ('CARD_PAYMENT', 'OTP_PAYMENT')
-                and txn.remittance_information
-            ),
-            extract=lambda txn: ParsedTransaction(
-                payee=txn.remittance_information[0],
-                narration=txn.bank_transaction_code or 'Card payment',
-                transaction_type=txn.bank_transaction_code
-            )
+            btc_in=tuple(_REVOLUT_CARD_BTCS),
+            min_remittance_lines=1,
+            condition=_rule_revolut_card_payment_condition,
+            extract=_rule_revolut_card_payment_extract,
         ),
-    ],
+    ),
     
     # -------------------------------------------------------------------------
     # Pekao
     # -------------------------------------------------------------------------
-    'pekao': [
+    'pekao': (
         # Add pekao-specific rules if needed
-    ],
+    ),
 }
 
 
+class RuleIndex:
+    """Rules bucketed by their declared features.
+
+    Rules that declare `n_lines` and/or `btc_in` are only returned as
+    candidates for transactions with a matching line count and bank
+    transaction code ("easy" rules). Rules without declared features
+    ("hard" rules) are candidates for every transaction. Candidate lists
+    preserve the original rule order, so first-match-wins semantics are
+    unchanged.
+    """
+
+    def __init__(self, rules: Sequence[BankRule]) -> None:
+        self.rules = tuple(rules)
+
+    def candidates(self, n_lines: int, btc: Optional[str]) -> Tuple[BankRule, ...]:
+        """Return the rules that may match the given features, in order.
+
+        Not memoized here; _Dispatcher caches the result per signature.
+        """
+        return tuple(
+            rule for rule in self.rules
+            if (rule.n_lines is None or rule.n_lines == n_lines)
+            and n_lines >= rule.min_remittance_lines
+            and (rule.btc_in is None or btc in rule.btc_in)
+        )
+
+
+def _apply_first_match(rules: Tuple[BankRule, ...], ctx: RuleContext) -> Optional[ParsedTransaction]:
+    """Apply the first rule in `rules` whose condition matches."""
+    for rule in rules:
+        if rule.condition(ctx):
+            return rule.extract(ctx)
+    return None
+
+
+class _Dispatcher:
+    """Rule dispatch state shared by all transactions.
+
+    Holds the per-bank rule indexes and the lookup caches, so the hot path
+    reads them as instance slots rather than module globals.
+    """
+
+    __slots__ = ('_bank_indexes', '_bank_keys', '_candidates_cache')
+
+    def __init__(self, bank_rules: Dict[str, Tuple[BankRule, ...]]) -> None:
+        # Rule indexes keyed by lowercased bank name, so dispatch is a single
+        # dict lookup instead of a scan over every bank.
+        self._bank_indexes: Dict[str, RuleIndex] = {
+            bank_name.lower(): RuleIndex(rules) for bank_name, rules in bank_rules.items()
+        }
+        # Lowercased bank names, keyed by the bank name as it appears on
+        # transactions. There are only a handful of distinct banks, so this
+        # avoids allocating a lowercased copy per transaction.
+        self._bank_keys: Dict[str, str] = {}
+        # Bank-specific candidates per (bank, n_lines, btc) signature.
+        # Signatures for which no bank rule can match map to an empty tuple,
+        # so those transactions go straight to the generic rules without
+        # evaluating any condition. Rule order is preserved; trying the
+        # last-matched rule first would break first-match-wins semantics.
+        self._candidates_cache: Dict[Tuple[str, int, Optional[str]], Tuple[BankRule, ...]] = {}
+
+    def register(self, bank_name: str, rules: Tuple[BankRule, ...]) -> None:
+        """Replace the rules for a bank and invalidate cached candidates."""
+        self._bank_indexes[bank_name.lower()] = RuleIndex(rules)
+        self._candidates_cache.clear()
+
+    def _get_bank_key(self, bank: str) -> str:
+        """Return the lowercased bank name used for rule lookup."""
+        key = self._bank_keys.get(bank)
+        if key is None:
+            key = self._bank_keys[bank] = bank.lower()
+        return key
+
+    def _get_candidates(self, bank_lower: str, n_lines: int, btc: Optional[str]) -> Tuple[BankRule, ...]:
+        """Return the bank-specific candidate rules for a signature."""
+        key = (bank_lower, n_lines, btc)
+        candidates = self._candidates_cache.get(key)
+        if candidates is None:
+            bank_index = self._bank_indexes.get(bank_lower)
+            candidates = bank_index.candidates(n_lines, btc) if bank_index is not None else ()
+            self._candidates_cache[key] = candidates
+        return candidates
+
+    def _apply(self, candidates: Tuple[BankRule, ...], ctx: RuleContext) -> Optional[ParsedTransaction]:
+        """Try the bank-specific candidates, then fall back to generic rules."""
+        if candidates:
+            parsed = _apply_first_match(candidates, ctx)
+            if parsed is not None:
+                return parsed
+        return _apply_generic(ctx)
+
+    def parse(self, txn: 'EnableBankingTransaction') -> Optional[ParsedTransaction]:
+        """See get_parsed_transaction."""
+        bank_lower = self._get_bank_key(txn.bank)
+        n_lines = len(txn.remittance_information)
+        btc = txn.bank_transaction_code
+        ctx = RuleContext(
+            txn=txn,
+            counterparty=_get_counterparty(txn),
+            n_lines=n_lines,
+            btc=btc,
+        )
+        return self._apply(self._get_candidates(bank_lower, n_lines, btc), ctx)
+
+    def parse_many(self, txns: Sequence['EnableBankingTransaction']) -> List[Optional[ParsedTransaction]]:
+        """See parse_many."""
+        results: List[Optional[ParsedTransaction]] = [None] * len(txns)
+        groups: Dict[Tuple[str, int, Optional[str]], List[int]] = collections.defaultdict(list)
+        get_bank_key = self._get_bank_key
+        for i, txn in enumerate(txns):
+            key = (get_bank_key(txn.bank), len(txn.remittance_information), txn.bank_transaction_code)
+            groups[key].append(i)
+
+        for (bank_lower, n_lines, btc), indices in groups.items():
+            candidates = self._get_candidates(bank_lower, n_lines, btc)
+            for i in indices:
+                txn = txns[i]
+                ctx = RuleContext(
+                    txn=txn,
+                    counterparty=_get_counterparty(txn),
+                    n_lines=n_lines,
+                    btc=btc,
+                )
+                results[i] = self._apply(candidates, ctx)
+        return results
+
+
+_DISPATCHER = _Dispatcher(BANK_RULES)
+
+
+def register_bank_rules(bank_name: str, rules: Sequence[BankRule]) -> None:
+    """Register (or replace) the rules for a bank.
+
+    Use this instead of mutating BANK_RULES directly so that the
+    rule index stays in sync.
+    """
+    rules = tuple(rules)
+    BANK_RULES[bank_name] = rules
+    _DISPATCHER.register(bank_name, rules)
+
+
 def get_parsed_transaction(txn: 'EnableBankingTransaction') -> Optional[ParsedTransaction]:
     """Apply bank-specific and generic rules to extract payee, narration, and type.
     
@@ -262,33 +505,24 @@ def get_parsed_transaction(txn: 'EnableBankingTransaction') -> Optional[ParsedTr
     Returns:
         ParsedTransaction if a rule matched, None otherwise
     """
-    # Get bank-specific rules (case-insensitive lookup)
-    bank_lower = txn.bank.lower()
-    bank_rules = None
-    
-    for bank_name, rules in BANK_RULES.items():
-        if bank_name.lower() == bank_lower:
-            bank_rules = rules
-            break
-    
-    # Try bank-specific rules first
-    if bank_rules:
-        for rule in bank_rules:
-            try:
-                if rule.condition(txn):
-                    return rule.extract(txn)
-            except (IndexError, AttributeError, TypeError):
-                continue
-    
-    # Fall back to generic rules
-    for rule in GENERIC_RULES:
-        try:
-            if rule.condition(txn):
-                return rule.extract(txn)
-        except (IndexError, AttributeError, TypeError):
-            continue
-    
-    return None
+    return _DISPATCHER.parse(txn)
+
+
+def parse_many(txns: Sequence['EnableBankingTransaction']) -> List[Optional[ParsedTransaction]]:
+    """Apply rules to many transactions at once.
+
+    Equivalent to `[get_parsed_transaction(txn) for txn in txns]`, but
+    transactions are grouped by (bank, n_lines, btc) signature so candidate
+    rules are resolved once per group rather than once per transaction.
+
+    Args:
+        txns: The transactions to process
+
+    Returns:
+        List with the ParsedTransaction (or None) for each transaction, in
+        the same order as `txns`.
+    """
+    return _DISPATCHER.parse_many(txns)
 
 
 # Keep backward compatibility
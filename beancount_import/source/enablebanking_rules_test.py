@@ -0,0 +1,194 @@
+"""Tests for EnableBanking parsing rules."""
+
+import datetime
+from decimal import Decimal
+from typing import Any, Dict
+
+import pytest
+
+from beancount_import.source.enablebanking import EnableBankingTransaction
+from beancount_import.source import enablebanking_rules
+from beancount_import.source.enablebanking_rules import (
+    BankRule,
+    ParsedTransaction,
+    RuleContext,
+    RuleIndex,
+    get_parsed_transaction,
+    parse_many,
+    register_bank_rules,
+)
+
+
+def _make_txn(**kwargs: Any) -> EnableBankingTransaction:
+    fields: Dict[str, Any] = dict(
+        entry_reference="ref1",
+        amount=Decimal("-10.00"),
+        currency="PLN",
+        credit_debit_indicator="DBIT",
+        booking_date=datetime.date(2025, 1, 1),
+        transaction_date=None,
+        value_date=None,
+        status="BOOK",
+        creditor_name=None,
+        creditor_iban=None,
+        creditor_address=None,
+        debtor_name=None,
+        debtor_iban=None,
+        debtor_address=None,
+        remittance_information=[],
+        bank_transaction_code=None,
+        balance_after=None,
+        account_id="PL123_PLN",
+        bank="mBank",
+        source_filename="mbank/transactions_PL123_PLN.json",
+    )
+    fields.update(kwargs)
+    return EnableBankingTransaction(**fields)
+
+
+class TestGenericRules:
+    def test_two_lines_with_counterparty(self):
+        txn = _make_txn(
+            creditor_name="SKLEP, UL. DLUGA 1",
+            remittance_information=["Zakupy", "BLIK"],
+        )
+        assert get_parsed_transaction(txn) == ParsedTransaction(
+            payee="SKLEP", narration="Zakupy", transaction_type="BLIK")
+
+    def test_two_lines_no_counterparty(self):
+        txn = _make_txn(remittance_information=["SKLEP", "PRZELEW"])
+        assert get_parsed_transaction(txn) == ParsedTransaction(
+            payee="SKLEP", narration="PRZELEW", transaction_type="PRZELEW")
+
+    def test_single_line_falls_back_to_bank(self):
+        txn = _make_txn(remittance_information=["Opis"])
+        assert get_parsed_transaction(txn) == ParsedTransaction(
+            payee="mBank", narration="Opis", transaction_type=None)
+
+    def test_counterparty_only(self):
+        txn = _make_txn(
+            creditor_name="KAUFLAND               MYSLOWICE",
+            bank_transaction_code="OPERACJA KARTĄ",
+        )
+        assert get_parsed_transaction(txn) == ParsedTransaction(
+            payee="KAUFLAND", narration="OPERACJA KARTĄ",
+            transaction_type="OPERACJA KARTĄ")
+
+    def test_no_match(self):
+        assert get_parsed_transaction(_make_txn()) is None
+
+
+class TestBankRules:
+    def test_revolut_card_payment_case_insensitive_bank(self):
+        txn = _make_txn(
+            bank="REVOLUT",
+            bank_transaction_code="CARD_PAYMENT",
+            remittance_information=["STARBUCKS", "ignored"],
+        )
+        assert get_parsed_transaction(txn) == ParsedTransaction(
+            payee="STARBUCKS", narration="CARD_PAYMENT",
+            transaction_type="CARD_PAYMENT")
+
+    def test_revolut_card_payment_without_remittance(self):
+        txn = _make_txn(
+            bank="Revolut",
+            bank_transaction_code="CARD_PAYMENT",
+            creditor_name="STARBUCKS",
+        )
+        assert get_parsed_transaction(txn) == ParsedTransaction(
+            payee="STARBUCKS", narration="CARD_PAYMENT",
+            transaction_type="CARD_PAYMENT")
+
+    def test_register_bank_rules(self, monkeypatch):
+        monkeypatch.setattr(enablebanking_rules, 'BANK_RULES',
+                            dict(enablebanking_rules.BANK_RULES))
+        monkeypatch.setattr(enablebanking_rules, '_DISPATCHER',
+                            enablebanking_rules._Dispatcher(
+                                enablebanking_rules.BANK_RULES))
+        txn = _make_txn(bank='testbank', remittance_information=["Opis"])
+        assert get_parsed_transaction(txn).narration == 'Opis'
+        register_bank_rules('TestBank', [
+            BankRule(
+                name='always',
+                condition=lambda ctx: True,
+                extract=lambda ctx: ParsedTransaction(
+                    payee='P', narration='N'),
+            ),
+        ])
+        assert get_parsed_transaction(txn) == ParsedTransaction(
+            payee='P', narration='N')
+
+
+class TestApplyGeneric:
+    @pytest.mark.parametrize('txn', [
+        _make_txn(),
+        _make_txn(creditor_name="SKLEP", remittance_information=["A", "BLIK"]),
+        _make_txn(remittance_information=["A", "Nieznany"]),
+        _make_txn(debtor_name="JAN", credit_debit_indicator="CRDT",
+                  remittance_information=["A"]),
+        _make_txn(remittance_information=["BLIK"]),
+        _make_txn(creditor_name="SKLEP"),
+        _make_txn(creditor_name="SKLEP", bank_transaction_code="FEE"),
+        _make_txn(remittance_information=["A", "B", "C"]),
+    ])
+    def test_matches_generic_rules(self, txn):
+        ctx = RuleContext(
+            txn=txn,
+            counterparty=enablebanking_rules._get_counterparty(txn),
+            n_lines=len(txn.remittance_information),
+            btc=txn.bank_transaction_code,
+        )
+        candidates = RuleIndex(enablebanking_rules.GENERIC_RULES).candidates(
+            ctx.n_lines, ctx.btc)
+        expected = enablebanking_rules._apply_first_match(candidates, ctx)
+        assert enablebanking_rules._apply_generic(ctx) == expected
+
+
+class TestParseMany:
+    def test_matches_get_parsed_transaction(self):
+        txns = [
+            _make_txn(remittance_information=["Opis"]),
+            _make_txn(bank="Revolut", bank_transaction_code="CARD_PAYMENT",
+                      remittance_information=["STARBUCKS"]),
+            _make_txn(),
+            _make_txn(creditor_name="SKLEP",
+                      remittance_information=["Zakupy", "BLIK"]),
+            _make_txn(remittance_information=["Inny opis"]),
+        ]
+        assert parse_many(txns) == [get_parsed_transaction(t) for t in txns]
+
+    def test_empty(self):
+        assert parse_many([]) == []
+
+
+class TestRuleIndex:
+    def _rule(self, name, **kwargs):
+        return BankRule(
+            name=name,
+            condition=lambda ctx: True,
+            extract=lambda ctx: ParsedTransaction(payee=name, narration='N'),
+            **kwargs)
+
+    def test_candidates_filtered_by_features(self):
+        index = RuleIndex([
+            self._rule('two_lines', n_lines=2),
+            self._rule('card', btc_in=('CARD_PAYMENT',)),
+            self._rule('hard'),
+        ])
+        assert [r.name for r in index.candidates(2, None)] == [
+            'two_lines', 'hard']
+        assert [r.name for r in index.candidates(1, 'CARD_PAYMENT')] == [
+            'card', 'hard']
+
+    def test_min_remittance_lines(self):
+        index = RuleIndex([
+            self._rule('needs_line', min_remittance_lines=1),
+            self._rule('hard'),
+        ])
+        assert [r.name for r in index.candidates(0, None)] == ['hard']
+        assert [r.name for r in index.candidates(3, None)] == [
+            'needs_line', 'hard']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -5,9 +5,12 @@ import json
 import os
 import tempfile
 from decimal import Decimal
+from typing import Any, List
 
 import pytest
+from beancount.core.data import Transaction
 
+from beancount_import.source import SourceResults, enablebanking
 from beancount_import.source.enablebanking import (
     EnableBankingSource,
     EnableBankingTransaction,
@@ -19,28 +22,24 @@ from beancount_import.source.enablebanking import (
 
 
 class TestParseDecimal:
-    def test_valid_decimal(self):
-        assert _parse_decimal("100.50") == Decimal("100.50")
-        assert _parse_decimal("1000") == Decimal("1000")
-    
-    def test_none_returns_none(self):
-        assert _parse_decimal(None) is None
-    
-    def test_empty_string_returns_none(self):
-        assert _parse_decimal("") is None
+    @pytest.mark.parametrize("value,expected", [
+        ("100.50", Decimal("100.50")),
+        ("1000", Decimal("1000")),
+        (None, None),
+        ("", None),
+    ])
+    def test_parse_decimal(self, value, expected):
+        assert _parse_decimal(value) == expected
 
 
 class TestParseDate:
-    def test_iso_date(self):
-        result = _parse_date("2024-01-15")
-        assert result == datetime.date(2024, 1, 15)
-    
-    def test_iso_datetime_truncated(self):
-        result = _parse_date("2024-01-15T10:30:00")
-        assert result == datetime.date(2024, 1, 15)
-    
-    def test_none_returns_none(self):
-        assert _parse_date(None) is None
+    @pytest.mark.parametrize("value,expected", [
+        ("2024-01-15", datetime.date(2024, 1, 15)),
+        ("2024-01-15T10:30:00", datetime.date(2024, 1, 15)),  # truncated
+        (None, None),
+    ])
+    def test_parse_date(self, value, expected):
+        assert _parse_date(value) == expected
 
 
 class TestParseTransaction:
@@ -144,9 +143,18 @@ class TestGenerateTransactionId:
 
 
 class TestEnableBankingSource:
-    @pytest.fixture
+    class _EmptyJournal:
+        all_entries: List[Any] = []
+
+        def get_postings_by_ref(self, key):
+            return {}
+
+    @pytest.fixture(scope="module")
     def test_data_dir(self):
-        """Create a temporary directory with test JSON files."""
+        """Create a temporary directory with test JSON files.
+
+        Shared by the tests below, which only read it.
+        """
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create mbank subdirectory
             mbank_dir = os.path.join(tmpdir, "mbank")
@@ -197,30 +205,27 @@ class TestEnableBankingSource:
             
             yield tmpdir
     
+    @pytest.fixture(scope="module")
+    def source(self, test_data_dir):
+        """Source loaded from test_data_dir, shared by read-only tests."""
+        return EnableBankingSource(
+            directory=test_data_dir,
+            default_account="Assets:Bank",
+            log_status=lambda x: None,
+        )
+    
     def test_requires_account_config(self):
         """Test that source requires account_map or default_account."""
         with tempfile.TemporaryDirectory() as tmpdir:
             with pytest.raises(ValueError, match="requires either"):
                 EnableBankingSource(directory=tmpdir, log_status=lambda x: None)
     
-    def test_loads_accounts(self, test_data_dir):
-        source = EnableBankingSource(
-            directory=test_data_dir,
-            default_account="Assets:Bank",
-            log_status=lambda x: None,
-        )
-        
+    def test_loads_accounts(self, source):
         assert len(source.accounts) == 1
         assert source.accounts[0].iban == "PL11111111111111111111111111"
         assert source.accounts[0].bank == "mBank"
     
-    def test_loads_transactions(self, test_data_dir):
-        source = EnableBankingSource(
-            directory=test_data_dir,
-            default_account="Assets:Bank",
-            log_status=lambda x: None,
-        )
-        
+    def test_loads_transactions(self, source):
         assert len(source.transactions) == 2
         
         # First transaction (debit)
@@ -231,6 +236,17 @@ class TestEnableBankingSource:
         assert source.transactions[1].amount == Decimal("50.00")
         assert source.transactions[1].debtor_name == "JOHN DOE"
     
+    def test_loads_without_orjson(self, test_data_dir, monkeypatch):
+        monkeypatch.setattr(enablebanking, 'orjson', None)
+        source = EnableBankingSource(
+            directory=test_data_dir,
+            default_account="Assets:Bank",
+            log_status=lambda x: None,
+        )
+
+        assert len(source.accounts) == 1
+        assert len(source.transactions) == 2
+    
     def test_account_map(self, test_data_dir):
         source = EnableBankingSource(
             directory=test_data_dir,
@@ -249,13 +265,7 @@ class TestEnableBankingSource:
         result = source._get_account_for_id("UNKNOWN_PLN")
         assert result == "Assets:Unknown"
     
-    def test_make_transaction_debit(self, test_data_dir):
-        source = EnableBankingSource(
-            directory=test_data_dir,
-            default_account="Assets:Bank",
-            log_status=lambda x: None,
-        )
-        
+    def test_make_transaction_debit(self, source):
         txn = source.transactions[0]  # Debit transaction
         beancount_txn = source._make_transaction(txn, "Assets:Bank")
         
@@ -271,13 +281,7 @@ class TestEnableBankingSource:
         assert beancount_txn.postings[1].account == "Expenses:FIXME"
         assert beancount_txn.postings[1].units.number == Decimal("100.00")
     
-    def test_make_transaction_credit(self, test_data_dir):
-        source = EnableBankingSource(
-            directory=test_data_dir,
-            default_account="Assets:Bank",
-            log_status=lambda x: None,
-        )
-        
+    def test_make_transaction_credit(self, source):
         txn = source.transactions[1]  # Credit transaction
         beancount_txn = source._make_transaction(txn, "Assets:Bank")
         
@@ -285,6 +289,21 @@ class TestEnableBankingSource:
         assert beancount_txn.payee == "JOHN DOE"  # Debtor as payee for incoming
         assert beancount_txn.postings[0].units.number == Decimal("50.00")
 
+    def test_prepare_creates_pending_transactions(self, source):
+        results = SourceResults()
+        source.prepare(self._EmptyJournal(), results)
+
+        transactions = [
+            entry
+            for result in results.pending
+            for entry in result.entries
+            if isinstance(entry, Transaction)
+        ]
+        assert [(t.payee, t.narration) for t in transactions] == [
+            ("mBank", "Test payment"),
+            ("JOHN DOE", "Incoming transfer"),
+        ]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
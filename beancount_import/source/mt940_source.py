@@ -37,8 +37,12 @@ Within your Python script for invoking beancount_import, use an expression like:
                 bank='nestbank',
             ),
         ],
+        cache_filename='/path/to/mt940/.cache.pickle',
     )
 
+The `cache_filename` key is optional.  When set, parsed statements are cached
+there and a file is only reparsed when its modification time or size changes.
+
 Imported transaction format
 ===========================
 
@@ -64,17 +68,19 @@ Supported banks
 
 import datetime
 import hashlib
+import mmap
 import os
-import re
+import pickle
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import mt940
 import mt940.models
 import mt940.tags
 
+from atomicwrites import atomic_write
 from beancount.core.data import Balance, Posting, Transaction, EMPTY_SET
 from beancount.core.flags import FLAG_OKAY
 from beancount.core.number import D, ZERO
@@ -83,6 +89,7 @@ from beancount.core.amount import Amount
 from . import ImportResult, Source, SourceResults, InvalidSourceReference
 from ..matching import FIXME_ACCOUNT
 from ..journal_editor import JournalEditor
+from .parse_helpers import DATACLASS_SLOTS, intern_string, map_files
 
 
 # Metadata keys (standardized across all bank sources)
@@ -135,11 +142,16 @@ class StatementPekao(mt940.tags.Statement):
         '''
 
 
+# Shared like mt940's built-in tags, so the pattern is compiled once rather
+# than per parsed file.
+_PEKAO_TAGS: Dict[Union[int, str], mt940.tags.Tag] = {StatementPekao.id: StatementPekao()}
+
+
 # =============================================================================
 # Field :86: Adapters - Parse bank-specific transaction details
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Field86Data:
     """Parsed data from :86: field."""
     transaction_type: Optional[str] = None
@@ -179,49 +191,40 @@ class PekaoAdapter(Field86Adapter):
     """
     
     def parse(self, raw: str) -> Field86Data:
-        data = Field86Data(raw=raw)
-        
         # Split by ^
         fields = self._split_fields(raw)
-        
-        data.transaction_type = fields.get('00')
+        get = fields.get
         
         # Title: concatenate 20, 21, 22, 23
-        title_parts = []
-        for key in ['20', '21', '22', '23']:
-            if key in fields and fields[key]:
-                title_parts.append(fields[key])
-        if title_parts:
-            data.title = ' '.join(title_parts)
-        
-        data.bank_code = fields.get('30')
+        title = ' '.join(
+            v for v in (get('20'), get('21'), get('22'), get('23')) if v)
         
         # Counterparty: concatenate 32, 33, 34
-        cp_parts = []
-        for key in ['32', '33', '34']:
-            if key in fields and fields[key] and fields[key] != '000':
-                cp_parts.append(fields[key])
-        if cp_parts:
-            data.counterparty = ' '.join(cp_parts)
-        
-        data.counterparty_iban = fields.get('38')
-        data.fx_rate_from = fields.get('51')
-        data.fx_rate_to = fields.get('52')
-        data.card_number = fields.get('62')
-        
-        return data
+        counterparty = ' '.join(
+            v for v in (get('32'), get('33'), get('34')) if v and v != '000')
+        
+        return Field86Data(
+            transaction_type=get('00'),
+            title=title or None,
+            counterparty=counterparty or None,
+            counterparty_iban=get('38'),
+            bank_code=get('30'),
+            card_number=get('62'),
+            fx_rate_from=get('51'),
+            fx_rate_to=get('52'),
+            raw=raw,
+        )
     
     def _split_fields(self, raw: str) -> Dict[str, str]:
         """Split ^XX formatted string into dict of field_code -> value."""
         fields = {}
-        # Pattern: ^XX followed by content until next ^XX or end
-        pattern = re.compile(r'\^(\d{2})([^^]*)')
-        for match in pattern.finditer(raw):
-            code = match.group(1)
-            value = match.group(2).strip()
-            # Remove newlines and clean up
-            value = ' '.join(value.split())
-            fields[code] = value
+        # Each ^ starts a field: two digit code, then content until next ^.
+        # The first chunk precedes any separator and is ignored.
+        for part in raw.split('^')[1:]:
+            code = part[:2]
+            if len(code) == 2 and code.isdecimal():
+                # Remove newlines and clean up
+                fields[code] = ' '.join(part[2:].split())
         return fields
 
 
@@ -241,51 +244,42 @@ class NestBankAdapter(Field86Adapter):
     """
     
     def parse(self, raw: str) -> Field86Data:
-        data = Field86Data(raw=raw)
-        
         fields = self._split_fields(raw)
-        
-        data.transaction_type = fields.get('00')
+        get = fields.get
         
         # Title: concatenate 20, 21, 22, 23
-        title_parts = []
-        for key in ['20', '21', '22', '23']:
-            if key in fields and fields[key]:
-                title_parts.append(fields[key])
-        if title_parts:
-            data.title = ' '.join(title_parts)
-        
-        data.bank_code = fields.get('30')
-        data.account_number = fields.get('31')
+        title = ' '.join(
+            v for v in (get('20'), get('21'), get('22'), get('23')) if v)
         
         # Counterparty: concatenate 27, 28, 29, 60
-        cp_parts = []
-        for key in ['27', '28', '29', '60']:
-            if key in fields and fields[key]:
-                cp_parts.append(fields[key])
-        if cp_parts:
-            data.counterparty = ' '.join(cp_parts)
-        
-        data.counterparty_iban = fields.get('38')
+        counterparty = ' '.join(
+            v for v in (get('27'), get('28'), get('29'), get('60')) if v)
         
         # Reference: parse from <63>REFxxx format
-        ref = fields.get('63', '')
-        if ref.startswith('REF'):
-            data.reference = ref
-        
-        return data
+        ref = get('63', '')
+        
+        return Field86Data(
+            transaction_type=get('00'),
+            title=title or None,
+            counterparty=counterparty or None,
+            counterparty_iban=get('38'),
+            bank_code=get('30'),
+            account_number=get('31'),
+            reference=ref if ref.startswith('REF') else None,
+            raw=raw,
+        )
     
     def _split_fields(self, raw: str) -> Dict[str, str]:
         """Split <XX> formatted string into dict of field_code -> value."""
         fields = {}
-        # Pattern: <XX> followed by content until next <XX> or end
-        pattern = re.compile(r'<(\d{2})>?([^<]*)')
-        for match in pattern.finditer(raw):
-            code = match.group(1)
-            value = match.group(2).strip()
-            # Remove newlines and clean up
-            value = ' '.join(value.split())
-            fields[code] = value
+        # Each < starts a field: two digit code, optional >, then content
+        # until next <. The first chunk precedes any separator and is ignored.
+        for part in raw.split('<')[1:]:
+            code = part[:2]
+            if len(code) == 2 and code.isdecimal():
+                value = part[3:] if part[2:3] == '>' else part[2:]
+                # Remove newlines and clean up
+                fields[code] = ' '.join(value.split())
         return fields
 
 
@@ -326,7 +320,7 @@ BANK_NAMES: Dict[str, str] = {
 # Data structures
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Mt940Transaction:
     """Represents a parsed transaction from MT940 statement."""
     value_date: datetime.date
@@ -344,9 +338,14 @@ class Mt940Transaction:
     counterparty: Optional[str] = None
     counterparty_iban: Optional[str] = None
     reference: Optional[str] = None
+    # Negated amount for the balancing posting, computed once at parse time
+    neg_amount: Decimal = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.neg_amount = -self.amount
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Mt940Statement:
     """Represents a parsed MT940 statement."""
     filename: str
@@ -354,28 +353,87 @@ class Mt940Statement:
     statement_number: str
     currency: str
     opening_balance: Decimal
-    opening_date: datetime.date
+    # Balance dates are None when the file does not give them; prepare falls
+    # back to the current date, so the fallback is never baked into the cache
+    opening_date: Optional[datetime.date]
     closing_balance: Decimal
-    closing_date: datetime.date
+    closing_date: Optional[datetime.date]
     transactions: List[Mt940Transaction] = field(default_factory=list)
 
 
-def _detect_file_encoding(filepath: str) -> str:
-    """Auto-detect file encoding."""
+def _read_file_text(filepath: str) -> Tuple[str, str]:
+    """Read a file once and decode it, auto-detecting the encoding.
+    
+    Returns:
+        Tuple of (encoding, decoded text with newlines normalized to \\n).
+    """
+    # Decode straight from a read-only mapping, without copying the file into
+    # an intermediate bytes object
+    with open(filepath, 'rb') as f:
+        try:
+            raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return 'utf-8', ''
+    
     # Try common encodings
     encodings = ['utf-8', 'iso-8859-2', 'windows-1250', 'cp1250']
     
-    for encoding in encodings:
-        try:
-            with open(filepath, 'r', encoding=encoding) as f:
-                content = f.read()
-                # Check if content looks valid (no replacement characters)
-                if '\ufffd' not in content:
-                    return encoding
-        except (UnicodeDecodeError, UnicodeError):
-            continue
+    with raw:
+        for encoding in encodings:
+            try:
+                # Strict decoding fails at the first invalid byte
+                content = str(raw, encoding)
+                break
+            except (UnicodeDecodeError, UnicodeError):
+                continue
+        else:
+            encoding = 'utf-8'  # Fallback
+            content = str(raw, encoding)
     
-    return 'utf-8'  # Fallback
+    # Match text-mode open(): universal newlines
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return encoding, content
+
+
+def _detect_file_encoding(filepath: str) -> str:
+    """Auto-detect file encoding."""
+    return _read_file_text(filepath)[0]
+
+
+_DEBIT_STATUSES = frozenset({'D', 'RD'})
+_ONE_DAY = datetime.timedelta(days=1)
+
+# Entry-level meta shared by all generated entries.  Consumers copy meta before
+# changing it (see matching.py), so one dict serves every entry.
+_ENTRY_META = {
+    'filename': '<mt940_source>',
+    'lineno': 0,
+}
+
+# The mt940 Transactions API differs between library versions, but is fixed
+# once imported.  Probe an instance, as these are instance attributes.
+_HAS_DATA = hasattr(mt940.models.Transactions(), 'data')
+_HAS_STATEMENTS = hasattr(mt940.models.Transactions(), 'statements')
+
+
+def _to_date(value):
+    """Convert an mt940 Date to a plain datetime.date; pass other values through."""
+    if type(value) is mt940.models.Date:
+        return datetime.date(value.year, value.month, value.day)
+    return value
+
+
+def _to_decimal(amount_obj) -> Decimal:
+    """Extract the amount of an mt940 Amount, or ZERO if missing."""
+    value = getattr(amount_obj, 'amount', None)
+    if value is None:
+        return ZERO
+    # mt940 already parses amounts to Decimal; avoid a str round-trip
+    if type(value) is Decimal:
+        return value
+    return D(str(value))
 
 
 def parse_mt940_file(
@@ -393,21 +451,13 @@ def parse_mt940_file(
     """
     adapter = ADAPTERS.get(bank, ADAPTERS['universal'])
     
-    # Detect encoding
-    encoding = _detect_file_encoding(filepath)
-    
-    # Read file content
-    with open(filepath, 'r', encoding=encoding) as f:
-        data = f.read()
+    # Read file content, detecting encoding
+    _, data = _read_file_text(filepath)
     
     # Configure mt940 parser
     if bank == 'pekao':
         # Use custom Statement tag for Pekao
-        transactions = mt940.models.Transactions(
-            tags={
-                StatementPekao.id: StatementPekao(),
-            }
-        )
+        transactions = mt940.models.Transactions(tags=_PEKAO_TAGS)
     else:
         transactions = mt940.models.Transactions()
     
@@ -428,33 +478,21 @@ def parse_mt940_file(
     # We need to reconstruct statements from the parsed data
     
     # Get statement-level data from the transactions object
-    stmt_data = transactions.data if hasattr(transactions, 'data') else {}
+    stmt_data = transactions.data if _HAS_DATA else {}
     
     for txn in transactions:
         txn_data = txn.data
         
         # Parse dates
-        value_date = txn_data.get('date')
-        if isinstance(value_date, mt940.models.Date):
-            value_date = datetime.date(value_date.year, value_date.month, value_date.day)
-        
-        entry_date = txn_data.get('entry_date')
-        if isinstance(entry_date, mt940.models.Date):
-            entry_date = datetime.date(entry_date.year, entry_date.month, entry_date.day)
+        value_date = _to_date(txn_data.get('date'))
+        entry_date = _to_date(txn_data.get('entry_date'))
         
         # Parse amount
-        amount_obj = txn_data.get('amount')
-        if hasattr(amount_obj, 'amount'):
-            amount = D(str(amount_obj.amount))
-        else:
-            amount = ZERO
+        amount = _to_decimal(txn_data.get('amount'))
         
         # Get status and adjust sign
-        status = txn_data.get('status', 'C')
-        if status in ('D', 'RD'):
-            amount = -abs(amount)
-        else:
-            amount = abs(amount)
+        status = intern_string(txn_data.get('status', 'C'))
+        amount = -abs(amount) if status in _DEBIT_STATUSES else abs(amount)
         
         # Parse :86: field
         raw_86 = txn_data.get('transaction_details', '')
@@ -465,7 +503,7 @@ def parse_mt940_file(
             entry_date=entry_date,
             amount=amount,
             status=status,
-            transaction_code=txn_data.get('id', ''),
+            transaction_code=intern_string(txn_data.get('id', '')),
             customer_reference=txn_data.get('customer_reference', ''),
             bank_reference=txn_data.get('bank_reference', ''),
             extra_details=txn_data.get('extra_details', ''),
@@ -480,8 +518,8 @@ def parse_mt940_file(
     
     # Extract statement-level info from the transactions object
     # The mt940 library stores this in the statement wrapper
-    if hasattr(transactions, 'statements'):
-        for stmt in transactions.statements:
+    if _HAS_STATEMENTS:
+        for stmt in getattr(transactions, 'statements'):
             stmt_d = stmt.data
             
             # Account IBAN
@@ -490,44 +528,47 @@ def parse_mt940_file(
                 account_id = account_id[1:]
             
             # Opening balance
+            opening_date: Optional[datetime.date]
             opening = stmt_d.get('opening_balance') or stmt_d.get('final_opening_balance')
             if opening:
-                opening_balance = D(str(opening.amount.amount)) if hasattr(opening.amount, 'amount') else ZERO
+                opening_balance = _to_decimal(opening.amount)
                 opening_date_obj = opening.date
                 if isinstance(opening_date_obj, mt940.models.Date):
                     opening_date = datetime.date(opening_date_obj.year, opening_date_obj.month, opening_date_obj.day)
                 else:
-                    opening_date = datetime.date.today()
+                    opening_date = None
                 currency = str(opening.amount.currency) if hasattr(opening.amount, 'currency') else 'PLN'
             else:
                 opening_balance = ZERO
-                opening_date = datetime.date.today()
+                opening_date = None
                 currency = 'PLN'
             
             # Closing balance
+            closing_date: Optional[datetime.date]
             closing = stmt_d.get('closing_balance') or stmt_d.get('final_closing_balance')
             if closing:
-                closing_balance = D(str(closing.amount.amount)) if hasattr(closing.amount, 'amount') else ZERO
+                closing_balance = _to_decimal(closing.amount)
                 closing_date_obj = closing.date
                 if isinstance(closing_date_obj, mt940.models.Date):
                     closing_date = datetime.date(closing_date_obj.year, closing_date_obj.month, closing_date_obj.day)
                 else:
-                    closing_date = datetime.date.today()
+                    closing_date = None
             else:
                 closing_balance = ZERO
-                closing_date = datetime.date.today()
+                closing_date = None
             
             # Statement number
             stmt_number = stmt_d.get('statement_number', '')
             
-            # Get transactions for this statement
-            stmt_txns = [t for t in current_txns]  # For now, all transactions
+            # Get transactions for this statement (for now, all transactions);
+            # the list is handed over, not copied
+            stmt_txns = current_txns
             
             statements.append(Mt940Statement(
                 filename=filepath,
-                account_iban=account_id,
+                account_iban=intern_string(account_id),
                 statement_number=str(stmt_number),
-                currency=currency,
+                currency=intern_string(currency),
                 opening_balance=opening_balance,
                 opening_date=opening_date,
                 closing_balance=closing_balance,
@@ -540,27 +581,72 @@ def parse_mt940_file(
     if not statements and current_txns:
         statements.append(Mt940Statement(
             filename=filepath,
-            account_iban=stmt_data.get('account_identification', '').lstrip('/'),
+            account_iban=intern_string(stmt_data.get('account_identification', '').lstrip('/')),
             statement_number='1',
             currency='PLN',
             opening_balance=ZERO,
-            opening_date=datetime.date.today(),
+            opening_date=None,
             closing_balance=ZERO,
-            closing_date=datetime.date.today(),
+            closing_date=None,
             transactions=current_txns,
         ))
     
     return statements
 
 
+def parse_mt940_files(
+    filepaths: List[str],
+    banks: List[str],
+) -> List[List[Mt940Statement]]:
+    """Parse several MT940 files, using worker processes when worthwhile.
+    
+    Args:
+        filepaths: Paths to the MT940 files.
+        banks: Bank identifier for :86: parsing, one per file.
+        
+    Returns:
+        One list of Mt940Statement objects per file, in input order.
+    """
+    return map_files(parse_mt940_file, filepaths, banks, chunksize=8)
+
+
 def _generate_transaction_id(account_iban: str, txn: Mt940Transaction) -> str:
     """Generate a unique ID for a transaction."""
     # Use date + amount + reference for uniqueness
     data = f"{txn.value_date}:{txn.amount}:{txn.extra_details or txn.customer_reference}"
+    # MD5 is not used for security here, but changing the digest would change
+    # the source_ref of every transaction already recorded in journals.
     hash_value = hashlib.md5(data.encode()).hexdigest()[:12]
     return f"mt940:{hash_value}"
 
 
+# Bump when parse results change, to invalidate existing caches
+_CACHE_VERSION = 3
+
+# Accepted MT940 file extensions
+_MT940_EXTENSIONS = frozenset({'.sta', '.txt', '.mt940', '.940'})
+
+
+def _iter_mt940_files(directory: str) -> Iterator[str]:
+    """Yield paths of MT940 files under directory, recursively.
+    
+    Like os.walk, unreadable directories are skipped and directory symlinks
+    are not followed.
+    """
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_mt940_files(entry.path)
+        elif entry.is_file():
+            name = entry.name
+            dot = name.rfind('.')
+            if dot >= 0 and name[dot:] in _MT940_EXTENSIONS:
+                yield entry.path
+
+
 def get_info(filename: str) -> dict:
     """Create info dict for import result."""
     return dict(
@@ -579,6 +665,7 @@ class Mt940Source(Source):
     def __init__(
         self,
         accounts: List[dict],
+        cache_filename: Optional[str] = None,
         **kwargs,
     ) -> None:
         """Initialize the MT940 source.
@@ -588,14 +675,17 @@ class Mt940Source(Source):
                 - directory: Path to MT940 files
                 - account: Beancount account name
                 - bank: Bank identifier ('pekao', 'nestbank', 'universal')
+            cache_filename: Optional path of a pickle file caching parsed
+                statements between runs.
             **kwargs: Additional arguments passed to Source.
         """
         super().__init__(**kwargs)
         self.accounts_config = accounts
+        self.cache_filename = cache_filename
         
         # Store loaded data
         self.statements: List[Tuple[Mt940Statement, str, str]] = []  # (stmt, account, bank)
-        self.transactions: List[Tuple[Mt940Statement, Mt940Transaction, str, str]] = []  # (stmt, txn, account, bank)
+        self.transactions: List[Tuple[Mt940Statement, Mt940Transaction, str, str, str]] = []  # (stmt, txn, account, bank, txn_id)
         
         # Load all data
         self._load_all_data()
@@ -606,6 +696,10 @@ class Mt940Source(Source):
     
     def _load_all_data(self) -> None:
         """Load all data from configured directories."""
+        # Collect files of all accounts first, so they are parsed in one batch
+        paths: List[str] = []
+        banks: List[str] = []
+        accounts: List[str] = []
         for config in self.accounts_config:
             directory = config['directory']
             account = config['account']
@@ -616,29 +710,78 @@ class Mt940Source(Source):
                 continue
             
             # Walk through all subdirectories
-            for root, dirs, files in os.walk(directory):
-                for filename in sorted(files):
-                    # Accept common MT940 extensions
-                    if not any(filename.endswith(ext) for ext in ['.sta', '.txt', '.mt940', '.940']):
-                        continue
-                    
-                    path = os.path.join(root, filename)
-                    
-
-                    
-                    # Parse file
-                    parsed_statements = parse_mt940_file(path, bank)
-                    
-                    for stmt in parsed_statements:
-                        self.statements.append((stmt, account, bank))
-                        for txn in stmt.transactions:
-                            self.transactions.append((stmt, txn, account, bank))
+            for path in sorted(_iter_mt940_files(directory)):
+                paths.append(path)
+                banks.append(bank)
+                accounts.append(account)
+        
+        # Parse files
+        parsed_files = self._parse_files(paths, banks)
+        for parsed_statements, account, bank in zip(parsed_files, accounts, banks):
+            for stmt in parsed_statements:
+                self.statements.append((stmt, account, bank))
+                for txn in stmt.transactions:
+                    txn_id = _generate_transaction_id(stmt.account_iban, txn)
+                    self.transactions.append((stmt, txn, account, bank, txn_id))
         
         self.log_status(
             f'mt940_source: loaded {len(self.statements)} statements, '
             f'{len(self.transactions)} transactions'
         )
     
+    def _parse_files(self, paths: List[str], banks: List[str]) -> List[List[Mt940Statement]]:
+        """Parse files, reusing cached results for unchanged files."""
+        if self.cache_filename is None:
+            return parse_mt940_files(paths, banks)
+        
+        cache = self._read_cache()
+        new_cache: Dict[str, Tuple[int, int, str, List[Mt940Statement]]] = {}
+        misses: List[int] = []
+        for i, (path, bank) in enumerate(zip(paths, banks)):
+            st = os.stat(path)
+            key = (st.st_mtime_ns, st.st_size, bank)
+            cached = cache.get(path)
+            if cached is not None and cached[:3] == key:
+                new_cache[path] = cached
+            else:
+                new_cache[path] = key + ([],)
+                misses.append(i)
+        
+        if misses:
+            parsed = parse_mt940_files(
+                [paths[i] for i in misses], [banks[i] for i in misses])
+            for i, statements in zip(misses, parsed):
+                new_cache[paths[i]] = new_cache[paths[i]][:3] + (statements,)
+        if misses or new_cache.keys() != cache.keys():
+            self._write_cache(new_cache)
+        return [new_cache[path][3] for path in paths]
+    
+    def _read_cache(self) -> Dict[str, Tuple[int, int, str, List[Mt940Statement]]]:
+        """Read cached parse results: path -> (mtime_ns, size, bank, statements)."""
+        cache_filename = self.cache_filename
+        assert cache_filename is not None
+        if not os.path.exists(cache_filename):
+            return {}
+        try:
+            with open(cache_filename, 'rb') as f:
+                cache_data = pickle.load(f)
+            if cache_data['version'] != _CACHE_VERSION:
+                raise RuntimeError('invalid version')
+            return cache_data['files']
+        except Exception as e:
+            self.log_status(f'mt940_source: not using cache due to an error: {e}')
+            return {}
+    
+    def _write_cache(self, files: Dict[str, Tuple[int, int, str, List[Mt940Statement]]]) -> None:
+        cache_filename = self.cache_filename
+        assert cache_filename is not None
+        cache_data = {
+            'version': _CACHE_VERSION,
+            'files': files,
+        }
+        with atomic_write(cache_filename, mode='wb', overwrite=True) as f:
+            pickle.dump(cache_data, f)
+    
     def get_example_key_value_pairs(
         self,
         transaction: Transaction,
@@ -675,9 +818,9 @@ class Mt940Source(Source):
         txn: Mt940Transaction,
         account: str,
         bank: str,
+        txn_id: str,
     ) -> Transaction:
         """Create a Beancount transaction from MT940 data."""
-        txn_id = _generate_transaction_id(stmt.account_iban, txn)
         
         # Determine payee and narration
         payee = txn.counterparty or None
@@ -717,7 +860,7 @@ class Mt940Source(Source):
         # FIXME posting for balancing
         fixme_posting = Posting(
             account=FIXME_ACCOUNT,
-            units=Amount(-txn.amount, stmt.currency),
+            units=Amount(txn.neg_amount, stmt.currency),
             cost=None,
             price=None,
             flag=None,
@@ -725,10 +868,7 @@ class Mt940Source(Source):
         )
         
         return Transaction(
-            meta={
-                'filename': '<mt940_source>',
-                'lineno': 0,
-            },
+            meta=_ENTRY_META,
             date=txn.value_date,
             flag=FLAG_OKAY,
             payee=payee,
@@ -747,73 +887,67 @@ class Mt940Source(Source):
         # Get all accounts we manage
         all_accounts = {config['account'] for config in self.accounts_config}
         
-        # Build set of already-matched transaction IDs
+        # Already-matched transaction IDs in our accounts.  The journal-wide
+        # ref index is built once and shared with other sources.
         matched_ids: Dict[str, List[Tuple[Transaction, Posting]]] = {}
+        for ref, pairs in journal.get_postings_by_ref(SOURCE_REF_KEY).items():
+            ours = [pair for pair in pairs if pair[1].account in all_accounts]
+            if ours:
+                matched_ids[ref] = ours
         
-        for entry in journal.all_entries:
-            if isinstance(entry, Transaction):
-                for posting in entry.postings:
-                    if posting.meta is None:
-                        continue
-                    if posting.account not in all_accounts:
-                        continue
-                    ref = posting.meta.get(SOURCE_REF_KEY)
-                    if ref is not None:
-                        matched_ids.setdefault(ref, []).append((entry, posting))
-        
-        # Track for balance assertions
-        balances_by_account: Dict[str, Tuple[datetime.date, Decimal, str]] = {}
+        # IDs of all loaded transactions
+        valid_ids = {txn_id for _, _, _, _, txn_id in self.transactions}
         
-        # Track valid IDs
-        valid_ids = set()
+        add_pending_entry = results.add_pending_entry
+        add_invalid_reference = results.add_invalid_reference
         
         # Process transactions
-        for stmt, txn, account, bank in self.transactions:
-            txn_id = _generate_transaction_id(stmt.account_iban, txn)
-            valid_ids.add(txn_id)
-            
+        for stmt, txn, account, bank, txn_id in self.transactions:
             existing = matched_ids.get(txn_id)
             if existing is not None:
                 if len(existing) > 1:
-                    results.add_invalid_reference(
+                    add_invalid_reference(
                         InvalidSourceReference(len(existing) - 1, existing))
             else:
                 # Create new transaction
-                beancount_txn = self._make_transaction(stmt, txn, account, bank)
-                results.add_pending_entry(
+                beancount_txn = self._make_transaction(stmt, txn, account, bank, txn_id)
+                add_pending_entry(
                     ImportResult(
                         date=txn.value_date,
                         entries=[beancount_txn],
                         info=get_info(stmt.filename),
                     ))
-            
-            # Track latest balance for this account
-            balances_by_account[account] = (stmt.closing_date, stmt.closing_balance, stmt.currency)
+        
+        # Latest closing balance per account
+        balances_by_account: Dict[str, Tuple[datetime.date, Decimal, str]] = {}
+        today = datetime.date.today()
+        for stmt, account, bank in self.statements:
+            closing_date = stmt.closing_date or today
+            current = balances_by_account.get(account)
+            if current is None or closing_date >= current[0]:
+                balances_by_account[account] = (closing_date, stmt.closing_balance, stmt.currency)
         
         # Generate balance assertions
         for account, (date, balance, currency) in balances_by_account.items():
             balance_entry = Balance(
-                meta={
-                    'filename': '<mt940_source>',
-                    'lineno': 0,
-                },
+                meta=_ENTRY_META,
                 account=account,
                 amount=Amount(balance, currency),
                 tolerance=None,
                 diff_amount=None,
-                date=date + datetime.timedelta(days=1),
+                date=date + _ONE_DAY,
             )
-            results.add_pending_entry(
+            add_pending_entry(
                 ImportResult(
                     date=date,
                     entries=[balance_entry],
                     info=get_info('<balance>'),
                 ))
         
-        # Report invalid references
+        # Report invalid references (in journal order, for stable output)
         for ref, entries in matched_ids.items():
-            if ref not in valid_ids and ref.startswith('mt940:'):
-                results.add_invalid_reference(
+            if ref not in valid_ids:
+                add_invalid_reference(
                     InvalidSourceReference(len(entries), entries))
 
 
@@ -821,5 +955,6 @@ def load(spec: dict, log_status: callable) -> Mt940Source:
     """Load the MT940 source from specification."""
     return Mt940Source(
         accounts=spec['accounts'],
+        cache_filename=spec.get('cache_filename'),
         log_status=log_status,
     )
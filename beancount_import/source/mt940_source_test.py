@@ -16,14 +16,20 @@ pytest.importorskip("mt940")
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
+from beancount.core.data import Balance, Transaction
+
+from beancount_import.source import SourceResults
 from beancount_import.source.mt940_source import (
+    Mt940Source,
     PekaoAdapter,
     NestBankAdapter,
     UniversalAdapter,
     Field86Data,
     parse_mt940_file,
+    parse_mt940_files,
     _generate_transaction_id,
     _detect_file_encoding,
+    _read_file_text,
 )
 
 
@@ -67,6 +73,14 @@ class TestPekaoAdapter:
         assert result.fx_rate_from == "PLN00001,000000"
         assert result.fx_rate_to == "EUR00004,362700"
 
+    def test_ignores_separator_without_field_code(self, adapter):
+        raw = "prefix^00PRZELEW^20Tytul ^ xx^2^32Jan   Kowalski"
+        result = adapter.parse(raw)
+
+        assert result.transaction_type == "PRZELEW"
+        assert result.title == "Tytul"
+        assert result.counterparty == "Jan Kowalski"
+
 
 class TestNestBankAdapter:
     """Test Nest Bank :86: field parsing."""
@@ -102,6 +116,14 @@ class TestNestBankAdapter:
         assert "DAWID SZWAJCA" in result.counterparty
         assert "MYSLOWICE" in result.counterparty  # <60> field included
 
+    def test_optional_closing_bracket(self, adapter):
+        raw = "<00>Przelew<20>Tytul<2x<27Jan"
+        result = adapter.parse(raw)
+
+        assert result.transaction_type == "Przelew"
+        assert result.title == "Tytul"
+        assert result.counterparty == "Jan"
+
 
 class TestUniversalAdapter:
     """Test auto-detection of separator format."""
@@ -153,6 +175,246 @@ class TestEncodingDetection:
         finally:
             os.unlink(temp_path)
 
+    def test_read_file_text_empty_file(self):
+        with tempfile.NamedTemporaryFile(suffix='.sta', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            assert _read_file_text(temp_path) == ('utf-8', '')
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_file_text_decodes_and_normalizes_newlines(self):
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.sta', delete=False) as f:
+            f.write(":20:Test\r\n:86:Przelew środków\r\n".encode('iso-8859-2'))
+            temp_path = f.name
+        
+        try:
+            encoding, text = _read_file_text(temp_path)
+            assert encoding == 'iso-8859-2'
+            assert text == ":20:Test\n:86:Przelew środków\n"
+        finally:
+            os.unlink(temp_path)
+
+
+SAMPLE_MT940 = """\
+:20:STMT1
+:25:/PL12345678901234567890123456
+:28C:00001/001
+:60F:C250101PLN1000,00
+:61:2501150115DN000000000050,00NTRFNONREF//12345
+:86:^00PRZELEW INTERNET^20Zakupy^32SKLEP SA
+:61:2501160116CN000000000100,00NTRFNONREF//12346
+:86:^00PRZELEW PRZYCHODZACY^20Wyplata^32JAN KOWALSKI
+:62F:C250131PLN1050,00
+"""
+
+
+class TestParseMt940File:
+    """Test parsing of a complete statement file."""
+
+    @pytest.fixture
+    def sample_path(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.sta', delete=False, encoding='utf-8') as f:
+            f.write(SAMPLE_MT940)
+            temp_path = f.name
+        yield temp_path
+        os.unlink(temp_path)
+
+    def test_parses_transactions(self, sample_path):
+        statements = parse_mt940_file(sample_path, 'pekao')
+        
+        assert len(statements) == 1
+        stmt = statements[0]
+        assert stmt.account_iban == "PL12345678901234567890123456"
+        
+        debit, credit = stmt.transactions
+        assert debit.value_date == datetime.date(2025, 1, 15)
+        assert type(debit.value_date) is datetime.date
+        assert debit.amount == Decimal("-50.00")
+        assert debit.status == 'D'
+        assert debit.transaction_type == "PRZELEW INTERNET"
+        assert debit.counterparty == "SKLEP SA"
+        
+        assert credit.amount == Decimal("100.00")
+        assert credit.title == "Wyplata"
+
+
+class TestParseMt940Files:
+    """Test parsing of several files at once."""
+
+    @pytest.mark.parametrize('num_files', [1, 5])
+    def test_matches_parse_mt940_file(self, num_files):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for i in range(num_files):
+                path = os.path.join(tmpdir, f'{i}.sta')
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(SAMPLE_MT940.replace('SKLEP SA', f'SKLEP {i}'))
+                paths.append(path)
+            
+            result = parse_mt940_files(paths, ['pekao'] * num_files)
+            
+            assert result == [parse_mt940_file(path, 'pekao') for path in paths]
+
+
+class TestMt940Source:
+    """Test loading and preparing entries from account directories."""
+
+    class _Journal:
+        """Stand-in for JournalEditor holding only the given entries."""
+
+        def __init__(self, all_entries=()):
+            self.all_entries = list(all_entries)
+
+        def get_postings_by_ref(self, key):
+            index = {}
+            for entry in self.all_entries:
+                for posting in entry.postings:
+                    ref = (posting.meta or {}).get(key)
+                    if ref is not None:
+                        index.setdefault(ref, []).append((entry, posting))
+            return index
+
+    @pytest.fixture
+    def source(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            accounts = []
+            for name, debit in (('pekao', '50,00'), ('other', '60,00')):
+                directory = os.path.join(tmpdir, name)
+                os.makedirs(os.path.join(directory, '2025'))
+                with open(os.path.join(directory, '2025', 'a.sta'), 'w', encoding='utf-8') as f:
+                    f.write(SAMPLE_MT940.replace('50,00N', debit + 'N'))
+                with open(os.path.join(directory, 'notes.pdf'), 'w') as f:
+                    f.write('ignored')
+                accounts.append(dict(
+                    directory=directory,
+                    account=f'Assets:Bank:{name.title()}',
+                    bank='pekao',
+                ))
+            yield Mt940Source(accounts=accounts, log_status=lambda x: None)
+
+    def test_loads_all_accounts(self, source):
+        assert [account for _, account, _ in source.statements] == [
+            'Assets:Bank:Pekao', 'Assets:Bank:Other']
+        assert len(source.transactions) == 4
+
+    def test_prepare(self, source):
+        results = SourceResults()
+        source.prepare(self._Journal(), results)
+        
+        entries = [e for r in results.pending for e in r.entries]
+        transactions = [e for e in entries if isinstance(e, Transaction)]
+        balances = [e for e in entries if isinstance(e, Balance)]
+        assert [(t.postings[0].account, t.postings[0].units.number) for t in transactions] == [
+            ('Assets:Bank:Pekao', Decimal('-50.00')),
+            ('Assets:Bank:Pekao', Decimal('100.00')),
+            ('Assets:Bank:Other', Decimal('-60.00')),
+            ('Assets:Bank:Other', Decimal('100.00')),
+        ]
+        assert transactions[0].postings[0].meta['source_ref'].startswith('mt940:')
+        assert sorted(b.account for b in balances) == [
+            'Assets:Bank:Other', 'Assets:Bank:Pekao']
+
+    def test_prepare_matches_existing_reference(self, source):
+        results = SourceResults()
+        source.prepare(self._Journal(), results)
+        existing = next(
+            e for r in results.pending for e in r.entries
+            if isinstance(e, Transaction))
+        stale = existing._replace(postings=[
+            existing.postings[0]._replace(
+                meta=dict(existing.postings[0].meta, source_ref='mt940:stale')),
+        ])
+
+        results = SourceResults()
+        source.prepare(self._Journal([existing, stale]), results)
+        
+        transactions = [
+            e for r in results.pending for e in r.entries
+            if isinstance(e, Transaction)]
+        assert len(transactions) == 3
+        assert [r.num_extras for r in results.invalid_references] == [1]
+        assert results.invalid_references[0].transaction_posting_pairs[0][0] is stale
+
+
+class TestMt940SourceCache:
+    """Test the optional parse cache."""
+
+    def test_reparses_only_changed_files(self, monkeypatch):
+        from beancount_import.source import mt940_source
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = os.path.join(tmpdir, 'statements')
+            os.makedirs(directory)
+            for name in ('a.sta', 'b.sta'):
+                with open(os.path.join(directory, name), 'w', encoding='utf-8') as f:
+                    f.write(SAMPLE_MT940)
+            cache_filename = os.path.join(tmpdir, 'cache.pickle')
+            
+            parsed = []
+            original_parse = mt940_source.parse_mt940_file
+            def parse(path, bank):
+                parsed.append(os.path.basename(path))
+                return original_parse(path, bank)
+            monkeypatch.setattr(mt940_source, 'parse_mt940_file', parse)
+            
+            def load():
+                return Mt940Source(
+                    accounts=[dict(directory=directory, account='Assets:Bank', bank='pekao')],
+                    cache_filename=cache_filename,
+                    log_status=lambda x: None,
+                )
+            
+            first = load()
+            assert parsed == ['a.sta', 'b.sta']
+            
+            del parsed[:]
+            second = load()
+            assert parsed == []
+            assert [t[4] for t in second.transactions] == [t[4] for t in first.transactions]
+            
+            with open(os.path.join(directory, 'b.sta'), 'a', encoding='utf-8') as f:
+                f.write('\n')
+            load()
+            assert parsed == ['b.sta']
+
+    def test_undated_balance_not_cached_as_today(self, monkeypatch):
+        from beancount_import.source import mt940_source
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = os.path.join(tmpdir, 'statements')
+            os.makedirs(directory)
+            with open(os.path.join(directory, 'a.sta'), 'w', encoding='utf-8') as f:
+                f.write(SAMPLE_MT940)
+            cache_filename = os.path.join(tmpdir, 'cache.pickle')
+            
+            def parse(path, bank):
+                return [mt940_source.Mt940Statement(
+                    filename=path, account_iban='PL1', statement_number='1',
+                    currency='PLN', opening_balance=Decimal('0'), opening_date=None,
+                    closing_balance=Decimal('10'), closing_date=None)]
+            monkeypatch.setattr(mt940_source, 'parse_mt940_file', parse)
+            
+            def load():
+                return Mt940Source(
+                    accounts=[dict(directory=directory, account='Assets:Bank')],
+                    cache_filename=cache_filename,
+                    log_status=lambda x: None,
+                )
+            
+            load()
+            source = load()
+            assert source.statements[0][0].closing_date is None
+            
+            results = SourceResults()
+            source.prepare(TestMt940Source._Journal(), results)
+            balances = [
+                e for r in results.pending for e in r.entries
+                if isinstance(e, Balance)]
+            assert [b.date for b in balances] == [
+                datetime.date.today() + datetime.timedelta(days=1)]
+
 
 class TestTransactionIdGeneration:
     """Test unique transaction ID generation."""
@@ -174,7 +436,7 @@ class TestTransactionIdGeneration:
         
         result = _generate_transaction_id("PL12345", txn)
         assert result.startswith("mt940:")
-        assert len(result) == 17  # "mt940:" + 12 char hash
+        assert len(result) == 18  # "mt940:" + 12 char hash
 
     def test_same_txn_same_id(self):
         from beancount_import.source.mt940_source import Mt940Transaction
@@ -0,0 +1,50 @@
+"""Helpers shared by the bank statement sources.
+
+Used by the EnableBanking, MT940 and Revolut sources to declare compact
+dataclasses, share repeated strings and parse many files in parallel.
+"""
+
+import concurrent.futures
+import sys
+from typing import Any, Callable, Dict, List, Sequence, TypeVar
+
+T = TypeVar('T')
+
+# dataclass(slots=True) requires Python 3.10; older versions fall back to
+# regular dataclasses.
+DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 4
+
+
+def intern_string(value):
+    """Intern low-cardinality strings (currencies, statuses, codes).
+
+    These repeat across every transaction of an import; interning shares one
+    object per distinct value.  Non-string values are returned unchanged.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def map_files(
+    fn: Callable[..., T],
+    *args: Sequence[Any],
+    chunksize: int = 1,
+) -> List[T]:
+    """Apply `fn` to each file, using worker processes when worthwhile.
+
+    Args:
+        fn: Picklable function parsing one file.
+        *args: Argument sequences, one item per file, as for map().
+        chunksize: Passed to ProcessPoolExecutor.map.
+
+    Returns:
+        The results of `fn`, in input order.
+    """
+    if not args or len(args[0]) < PARALLEL_MIN_FILES:
+        return list(map(fn, *args))
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        return list(executor.map(fn, *args, chunksize=chunksize))
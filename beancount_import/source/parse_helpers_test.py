@@ -0,0 +1,29 @@
+"""Tests for the helpers shared by the bank statement sources."""
+
+import pytest
+
+from . import parse_helpers
+
+
+class TestInternString:
+
+    def test_interns_strings(self):
+        value = ''.join(['PL', 'N'])
+        assert parse_helpers.intern_string(value) is parse_helpers.intern_string('PLN')
+
+    def test_passes_through_other_values(self):
+        assert parse_helpers.intern_string(None) is None
+
+
+class TestMapFiles:
+
+    @pytest.mark.parametrize('num_files', [0, 1, parse_helpers.PARALLEL_MIN_FILES + 1])
+    def test_results_in_input_order(self, num_files):
+        values = list(range(-num_files, 0))
+        assert parse_helpers.map_files(abs, values) == [abs(v) for v in values]
+
+    def test_multiple_argument_sequences(self):
+        bases = [2] * 6
+        exponents = list(range(6))
+        assert parse_helpers.map_files(pow, bases, exponents, chunksize=2) == [
+            1, 2, 4, 8, 16, 32]
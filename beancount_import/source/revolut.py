@@ -8,6 +8,10 @@ with additional metadata from PDF statements. CSV files are the primary data
 source, while PDF files provide supplementary information like IBANs, exchange
 rates, card numbers, and merchant addresses.
 
+PDF text is extracted with the `pdftotext` tool from poppler-utils.  With
+`use_pymupdf=True` it is extracted in-process with PyMuPDF (`fitz`) instead,
+which must then be installed.
+
 Directory structure:
     revolut/
       personal/
@@ -43,6 +47,7 @@ Specifying the source to beancount_import
             'pro_USD': 'Assets:Revolut:Pro:USD',
         },
         default_account='Assets:Revolut:Unknown',
+        use_pymupdf=False,  # Optional: extract PDF text with PyMuPDF
     )
 
 Imported transaction format
@@ -65,26 +70,34 @@ Transactions are generated with metadata from both CSV and PDF:
       Expenses:FIXME          627.36 PLN
 """
 
-import collections
 import csv
 import datetime
+import functools
 import hashlib
 import io
+import operator
 import os
 import re
 import subprocess
+import sys
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Set, Union
 
 from beancount.core.data import Balance, Document, Posting, Transaction, EMPTY_SET
 from beancount.core.flags import FLAG_OKAY
-from beancount.core.number import D, ZERO
+from beancount.core.number import ZERO
 from beancount.core.amount import Amount
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # Optional: only needed with use_pymupdf=True
+    fitz = None
+
 from . import ImportResult, Source, SourceResults, InvalidSourceReference
 from ..matching import FIXME_ACCOUNT
 from ..journal_editor import JournalEditor
+from .parse_helpers import DATACLASS_SLOTS, map_files
 
 
 # Metadata keys (standardized across all bank sources)
@@ -144,30 +157,34 @@ def parse_revolut_date(text: str) -> datetime.date:
         datetime.date object.
     """
     text = text.strip()
-    # Format: 2025-01-02 02:19:20
-    try:
-        return datetime.datetime.strptime(text, "%Y-%m-%d %H:%M:%S").date()
-    except ValueError:
-        pass
-    # Try date only
+    # Format: 2025-01-02 02:19:20, or date only.  Both are ISO 8601, which
+    # fromisoformat parses far faster than strptime.
     try:
-        return datetime.datetime.strptime(text, "%Y-%m-%d").date()
+        return datetime.datetime.fromisoformat(text).date()
     except ValueError:
         raise ValueError(f"Cannot parse date: {text}")
 
 
+@functools.lru_cache(maxsize=16384)
+def _parse_decimal(text: str) -> Decimal:
+    """Memoized Decimal parsing; fee and balance columns repeat a lot."""
+    # Like beancount's D(): commas and spaces are thousands separators, and
+    # unparseable text raises ValueError
+    try:
+        return Decimal(text.replace(',', '').replace(' ', ''))
+    except InvalidOperation:
+        raise ValueError(f"Cannot parse amount: {text}")
+
+
 def parse_revolut_amount(text: str) -> Decimal:
     """Parse Revolut amount format: '-15.00' or '1000.00'."""
     text = text.strip()
     if not text:
         return ZERO
-    try:
-        return D(text)
-    except InvalidOperation:
-        return ZERO
+    return _parse_decimal(text)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RevolutTransaction:
     """Represents a parsed transaction from CSV."""
     transaction_type: str
@@ -199,9 +216,11 @@ class RevolutTransaction:
     original_amount: Optional[str] = None
     original_currency: Optional[str] = None
     exchange_rate: Optional[str] = None
+    # Source reference ID, set on first use by _transaction_id
+    txn_id: Optional[str] = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CsvStatementInfo:
     """Metadata about a parsed CSV statement."""
     filename: str
@@ -210,7 +229,7 @@ class CsvStatementInfo:
     transactions: List[RevolutTransaction] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PdfTransactionInfo:
     """Supplementary data from PDF for a single transaction."""
     date: datetime.date
@@ -228,19 +247,90 @@ class PdfTransactionInfo:
     original_amount: Optional[str] = None
     original_currency: Optional[str] = None
     exchange_rate: Optional[str] = None
+    # Set once a CSV transaction has been enriched from this entry
+    matched: bool = field(default=False, init=False, repr=False, compare=False)
+    # Lowercased first and second words of `description`, for matching
+    description_keys: Tuple[str, str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.description_keys = _description_keys(self.description)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PdfCurrencySection:
     """A currency section within a PDF (e.g., PLN Statement, EUR Statement)."""
     currency: str
     filename: Optional[str] = None  # Source PDF filename
     ibans: List[str] = field(default_factory=list)
     transactions: List[PdfTransactionInfo] = field(default_factory=list)
+    # Account IBANs picked from `ibans` (LT main, PL secondary)
+    iban_lt: Optional[str] = field(init=False, default=None)
+    iban_pl: Optional[str] = field(init=False, default=None)
+    # Date index over `transactions`, maintained by _pdf_transactions_by_date
+    _by_date: Dict[datetime.date, List[PdfTransactionInfo]] = field(
+        init=False, repr=False, compare=False, default_factory=dict)
+    _indexed: int = field(init=False, repr=False, compare=False, default=0)
+    
+    def __post_init__(self) -> None:
+        self.iban_lt, self.iban_pl = _split_ibans(self.ibans)
 
 
-def extract_pdf_text(pdf_path: str) -> str:
-    """Extract text from PDF using pdftotext."""
+def _pdf_transactions_by_date(
+    section: PdfCurrencySection,
+) -> Dict[datetime.date, List[PdfTransactionInfo]]:
+    """Return the section's transactions grouped by date.
+    
+    The index is kept on the section and only transactions appended since
+    the last call are added, so statements sharing a section reuse it.
+    """
+    by_date = section._by_date
+    for pdf_txn in section.transactions[section._indexed:]:
+        by_date.setdefault(pdf_txn.date, []).append(pdf_txn)
+    section._indexed = len(section.transactions)
+    return by_date
+
+
+def _split_ibans(ibans: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Return the last LT and the last PL IBAN in `ibans`, if any."""
+    iban_lt = None
+    iban_pl = None
+    for iban in ibans:
+        if iban.startswith('LT'):
+            iban_lt = iban
+        elif iban.startswith('PL'):
+            iban_pl = iban
+    return iban_lt, iban_pl
+
+
+def _words_to_lines(words) -> List[str]:
+    """Rebuild text lines from PyMuPDF words.
+
+    Words whose vertical centres are within half a word height of each other
+    form one line, ordered left to right.  This keeps a table row (date,
+    description, amounts) on a single line like `pdftotext -layout` does.
+    """
+    lines: List[List[Tuple[float, str]]] = []
+    line_mid = 0.0
+    for x0, y0, x1, y1, word, *_ in sorted(
+            words, key=lambda w: ((w[1] + w[3]) / 2, w[0])):
+        mid = (y0 + y1) / 2
+        if not lines or mid - line_mid > (y1 - y0) / 2:
+            lines.append([])
+            line_mid = mid
+        lines[-1].append((x0, word))
+    return [' '.join(word for _, word in sorted(line)) for line in lines]
+
+
+def extract_pdf_text(pdf_path: str, use_pymupdf: bool = False) -> str:
+    """Extract text from PDF using pdftotext, or PyMuPDF if requested."""
+    if use_pymupdf:
+        if fitz is None:
+            raise RuntimeError("use_pymupdf requires PyMuPDF to be installed.")
+        with fitz.open(pdf_path) as doc:
+            return '\n'.join(
+                line
+                for page in doc
+                for line in _words_to_lines(page.get_text('words')))
     try:
         result = subprocess.run(
             ['pdftotext', '-layout', pdf_path, '-'],
@@ -255,113 +345,183 @@ def extract_pdf_text(pdf_path: str) -> str:
         raise RuntimeError("pdftotext not found. Please install poppler-utils.")
 
 
-def parse_pdf(pdf_path: str) -> Dict[str, PdfCurrencySection]:
+# Start of a parse_pdf line: a currency section header ("PLN Statement") or a
+# transaction date, English ("Jan 3, 2025") or Polish ("3 sty 2025"), followed
+# by the rest of the line.
+# Polish months: sty, lut, mar, kwi, maj, cze, lip, sie, wrz, paź, lis, gru
+_LINE_START_RE = re.compile(
+    r'\s*(?:'
+    r'(?P<header>[A-Z]{3})\s+Statement\s*$'
+    r'|(?P<date>[A-Z][a-z]{2}\s+\d{1,2},\s+\d{4})'
+    r'|(?P<polish_date>(?P<day>\d{1,2})\s+'
+    r'(?P<month>sty|lut|mar|kwi|maj|cze|lip|sie|wrz|paź|lis|gru)\s+(?P<year>\d{4}))'
+    r')(?P<rest>.*)'
+)
+
+# parse_pdf patterns - English format
+# Matched over the whole text; the label and number share a line
+_IBAN_RE = re.compile(r'IBAN[^\S\n]+([A-Z]{2}[A-Z0-9]{10,32})')
+_CARD_RE = re.compile(r'Card:\s*(\d{6}\*+\d{4})')
+_TO_RE = re.compile(r'To:\s*(.+)')
+_FROM_RE = re.compile(r'From:\s*(.+)')
+_REFERENCE_RE = re.compile(r'Reference:\s*(.+)')
+_RATE_RE = re.compile(r'Revolut Rate\s+(.+?)\s*\(ECB')
+
+# parse_pdf patterns - Polish format (credit card statements)
+_POLISH_CARD_RE = re.compile(r'Karta:\s*(\d{6}\*+\d{4})')
+_POLISH_TO_RE = re.compile(r'Do:\s*(.+)')
+_POLISH_FROM_RE = re.compile(r'Od:\s*(.+)')
+_POLISH_RATE_RE = re.compile(r'Kurs Revolut:\s*(.+?)\s*\(kurs ECB', re.IGNORECASE)
+
+# Labels that start the detail patterns above, named by the field they fill.
+# A label is required for its pattern to match anywhere in the line.
+_DETAIL_LABEL_RE = re.compile(
+    r'(?P<reference>Reference:)'
+    r'|(?P<card>Card:|Karta:)'
+    r'|(?P<to>To:|Do:)'
+    r'|(?P<from>From:|Od:)'
+    r'|(?P<rate>Revolut Rate)'
+    r'|(?P<polish_rate>(?i:Kurs Revolut:))'
+)
+
+# Polish month name to number mapping
+_POLISH_MONTHS = {
+    'sty': 1, 'lut': 2, 'mar': 3, 'kwi': 4, 'maj': 5, 'cze': 6,
+    'lip': 7, 'sie': 8, 'wrz': 9, 'paź': 10, 'lis': 11, 'gru': 12
+}
+
+# Amount with currency on a transaction line: "1,000.00 PLN" or "€23.36" or "$151.05"
+_AMOUNT_CODE_RE = re.compile(r'([\d,]+\.\d{2})\s+([A-Z]{3})')
+_AMOUNT_SYMBOL_RE = re.compile(r'[€$£][\d,]+\.\d{2}')
+# A word of a transaction line that starts the amount columns: "€23" or
+# "1,000.00" (see _looks_like_amount)
+_SYMBOL_WORD_RE = re.compile(r'^[€$£][\d,]+')
+# Pattern for original currency amount on its own line: €4.43, $151.05
+_ORIG_CURRENCY_RE = re.compile(r'^\s*([€$£])([0-9,.]+)\s*$')
+# Original amount at the end of a rate line: "€17.00" (or "34.99 PLN", see
+# _tail_amount_currency)
+_TRAILING_SYMBOL_AMOUNT_RE = re.compile(r'([€$£])([0-9,.]+)\s*$')
+# Pattern to extract IBAN from "NAME, IBAN" format
+_IBAN_IN_ADDRESS_RE = re.compile(r'^(.+?),\s*([A-Z]{2}[A-Z0-9]{10,32})$')
+# Pattern to extract BBAN from "NAME, 26-digit-number" format (Polish account number)
+_BBAN_IN_ADDRESS_RE = re.compile(r'^(.+?),\s*(\d{26})$')
+
+
+def _looks_like_amount(word: str) -> bool:
+    r"""Whether `word` is a bare amount like "1,000.00".
+    
+    Same result as matching ^[\d,]+\.\d{2}$ on a whitespace-free word.
+    """
+    if len(word) < 4 or word[-3] != '.' or not word[-2:].isdecimal():
+        return False
+    integer_part = word[:-3].replace(',', '')
+    return not integer_part or integer_part.isdecimal()
+
+
+def _tail_amount_currency(line: str) -> Optional[Tuple[str, str]]:
+    r"""Split a trailing "3,306.96 CZK" off a line into (amount, currency).
+    
+    Same result as searching for ([0-9,.]+)\s+([A-Z]{3})\s*$, using string
+    methods on lines that have already been through several regexes.
+    """
+    parts = line.rsplit(None, 1)
+    if len(parts) != 2:
+        return None
+    head, currency = parts
+    if not (len(currency) == 3 and currency.isascii() and currency.isalpha()
+            and currency.isupper()):
+        return None
+    amount = head[len(head.rstrip('0123456789,.')):]
+    if not amount:
+        return None
+    return amount, currency
+
+
+def parse_pdf(
+    pdf_path: str,
+    wanted_currencies: Optional[Set[str]] = None,
+    use_pymupdf: bool = False,
+) -> Dict[str, PdfCurrencySection]:
     """Parse PDF statement for supplementary transaction data.
     
+    Args:
+        pdf_path: Path to the PDF statement.
+        wanted_currencies: If given, transaction details are only collected
+            for these currencies; sections for other currencies are still
+            returned, but empty.
+        use_pymupdf: Extract the text with PyMuPDF instead of pdftotext.
+    
     Returns:
         Dictionary mapping currency code to PdfCurrencySection.
     """
-    text = extract_pdf_text(pdf_path)
+    text = extract_pdf_text(pdf_path, use_pymupdf)
     lines = text.split('\n')
+    # Classify each line once; transaction detail scans reuse this
+    line_starts = [_LINE_START_RE.match(line) for line in lines]
     
+    filename = os.path.basename(pdf_path)
     sections: Dict[str, PdfCurrencySection] = {}
     current_section: Optional[PdfCurrencySection] = None
     
-    # Collect all IBANs globally first
-    global_ibans: List[str] = []
-    iban_pattern = re.compile(r'IBAN\s+([A-Z]{2}[A-Z0-9]{10,32})')
-    for line in lines:
-        iban_match = iban_pattern.search(line)
-        if iban_match:
-            iban = iban_match.group(1)
-            if iban not in global_ibans:
-                global_ibans.append(iban)
-    
-    # Patterns - English format
-    currency_header_pattern = re.compile(r'^\s*([A-Z]{3})\s+Statement\s*$')
-    date_pattern = re.compile(r'^([A-Z][a-z]{2}\s+\d{1,2},\s+\d{4})')  # "Jan 3, 2025"
-    card_pattern = re.compile(r'Card:\s*(\d{6}\*+\d{4})')
-    to_pattern = re.compile(r'To:\s*(.+)')
-    from_pattern = re.compile(r'From:\s*(.+)')
-    reference_pattern = re.compile(r'Reference:\s*(.+)')
-    
-    # Patterns - Polish format (credit card statements)
-    # Polish months: sty, lut, mar, kwi, maj, cze, lip, sie, wrz, paź, lis, gru
-    polish_date_pattern = re.compile(r'^(\d{1,2})\s+(sty|lut|mar|kwi|maj|cze|lip|sie|wrz|paź|lis|gru)\s+(\d{4})')
-    polish_card_pattern = re.compile(r'Karta:\s*(\d{6}\*+\d{4})')
-    polish_to_pattern = re.compile(r'Do:\s*(.+)')
-    polish_from_pattern = re.compile(r'Od:\s*(.+)')
-    
-    # Pattern for original currency amount on its own line: €4.43, $151.05
-    orig_currency_pattern = re.compile(r'^\s*([€$£])([0-9,.]+)\s*$')
-    # Pattern to extract IBAN from "NAME, IBAN" format
-    iban_in_address_pattern = re.compile(r'^(.+?),\s*([A-Z]{2}[A-Z0-9]{10,32})$')
-    # Pattern to extract BBAN from "NAME, 26-digit-number" format (Polish account number)
-    bban_in_address_pattern = re.compile(r'^(.+?),\s*(\d{26})$')
-    
-    # Polish month name to number mapping
-    polish_months = {
-        'sty': 1, 'lut': 2, 'mar': 3, 'kwi': 4, 'maj': 5, 'cze': 6,
-        'lip': 7, 'sie': 8, 'wrz': 9, 'paź': 10, 'lis': 11, 'gru': 12
-    }
+    # Collect all IBANs globally first, in order of first appearance
+    global_ibans: List[str] = list(dict.fromkeys(_IBAN_RE.findall(text)))
+    # IBANs for every transaction - prefer LT as main, PL as secondary
+    txn_iban, txn_iban_pl = _split_ibans(global_ibans)
+    if not txn_iban and global_ibans:
+        txn_iban = global_ibans[0]
     
     i = 0
     while i < len(lines):
-        line = lines[i]
+        start = line_starts[i]
+        if start is None:
+            i += 1
+            continue
         
         # Check for currency section header (e.g., "PLN Statement")
-        header_match = currency_header_pattern.search(line)
-        if header_match:
-            currency = header_match.group(1)
+        currency = start.group('header')
+        if currency:
             if currency not in sections:
                 current_section = PdfCurrencySection(
                     currency=currency,
-                    filename=os.path.basename(pdf_path),
+                    filename=filename,
+                    ibans=global_ibans.copy(),
                 )
-                current_section.ibans = global_ibans.copy()
                 sections[currency] = current_section
             else:
                 current_section = sections[currency]
             i += 1
             continue
         
-        # Look for transaction lines (start with date - English or Polish format)
-        date_match = date_pattern.match(line.strip())
-        polish_date_match = polish_date_pattern.match(line.strip())
-        
+        # Otherwise this is a transaction line (starts with date - English or Polish format)
         txn_date = None
-        date_str = None
         
-        if date_match:
+        if start.group('date'):
             # English format: "Jan 3, 2025"
             try:
-                date_str = date_match.group(1)
+                date_str = start.group('date')
                 txn_date = datetime.datetime.strptime(date_str, "%b %d, %Y").date()
             except ValueError:
                 pass
-        elif polish_date_match:
+        else:
             # Polish format: "3 sty 2025"
             try:
-                day = int(polish_date_match.group(1))
-                month_name = polish_date_match.group(2)
-                year = int(polish_date_match.group(3))
-                month = polish_months.get(month_name, 1)
+                day = int(start.group('day'))
+                month_name = start.group('month')
+                year = int(start.group('year'))
+                month = _POLISH_MONTHS.get(month_name, 1)
                 txn_date = datetime.date(year, month, day)
-                date_str = polish_date_match.group(0)
             except (ValueError, KeyError):
                 pass
         
         if txn_date:
             
             # Extract description (between date and first amount)
-            rest_of_line = line.strip()[len(date_str):].strip()
+            rest_of_line = start.group('rest').strip()
             
             # Find amount with currency to detect which section this belongs to
             # Pattern: "1,000.00 PLN" or "€23.36" or "$151.05"
-            amount_pattern_re = re.compile(r'([\d,]+\.\d{2})\s+([A-Z]{3})')
-            symbol_amount_pattern = re.compile(r'[€$£][\d,]+\.\d{2}')
-            amount_match = amount_pattern_re.search(rest_of_line)
-            symbol_match = symbol_amount_pattern.search(rest_of_line)
+            amount_match = _AMOUNT_CODE_RE.search(rest_of_line)
+            symbol_match = _AMOUNT_SYMBOL_RE.search(rest_of_line)
             
             # Detect currency from the line
             detected_currency = None
@@ -384,59 +544,78 @@ def parse_pdf(pdf_path: str) -> Dict[str, PdfCurrencySection]:
                 words = rest_of_line.split()
                 desc_words = []
                 for word in words:
-                    if re.match(r'^[\d,]+\.\d{2}$', word) or re.match(r'^[€$£][\d,]+', word):
+                    if _looks_like_amount(word) or _SYMBOL_WORD_RE.match(word):
                         break
                     desc_words.append(word)
                 description = ' '.join(desc_words)
             
+            # Use detected_currency to select/create section
+            target_section: Optional[PdfCurrencySection]
+            if detected_currency:
+                if detected_currency not in sections:
+                    sections[detected_currency] = PdfCurrencySection(
+                        currency=detected_currency,
+                        filename=filename,
+                        ibans=global_ibans.copy()
+                    )
+                target_section = sections[detected_currency]
+            else:
+                # Fallback to current section if no currency detected
+                target_section = current_section
+            
+            # Skip the detail lines of transactions nobody will match
+            if target_section is None or (
+                    wanted_currencies is not None
+                    and target_section.currency not in wanted_currencies):
+                i += 1
+                continue
+            
             # Create transaction info
             txn_info = PdfTransactionInfo(
                 date=txn_date,
                 description=description,
                 amount=None,
+                iban=txn_iban,
+                iban_pl=txn_iban_pl,
             )
             
-            # Set IBANs - prefer LT as main, PL as secondary
-            for iban in global_ibans:
-                if iban.startswith('LT'):
-                    txn_info.iban = iban
-                elif iban.startswith('PL'):
-                    txn_info.iban_pl = iban
-            if not txn_info.iban and global_ibans:
-                txn_info.iban = global_ibans[0]
-            
             # Look at following lines for details (up to 6 lines or next date)
             j = i + 1
             while j < min(i + 8, len(lines)):
                 detail_line = lines[j]
                 
                 # Stop if we hit another date line (English or Polish format)
-                if date_pattern.match(detail_line.strip()) or polish_date_pattern.match(detail_line.strip()):
+                detail_start = line_starts[j]
+                if detail_start is not None and not detail_start.group('header'):
                     break
                 
+                # One scan finds which detail labels the line has; only
+                # their patterns are then run
+                labels = {m.lastgroup for m in _DETAIL_LABEL_RE.finditer(detail_line)}
+                
                 # Check for Reference: (transfer title)
-                ref_match = reference_pattern.search(detail_line)
+                ref_match = _REFERENCE_RE.search(detail_line) if 'reference' in labels else None
                 if ref_match:
                     txn_info.reference = ref_match.group(1).strip()
                 
                 # Check for card number (Card: or Karta:)
-                card_match = card_pattern.search(detail_line) or polish_card_pattern.search(detail_line)
+                card_match = (_CARD_RE.search(detail_line) or _POLISH_CARD_RE.search(detail_line)) if 'card' in labels else None
                 if card_match:
                     txn_info.card_number = card_match.group(1)
                 
                 # Check for To:/Do: address (recipient for payments)
                 # Format: "To: Name, Address" or "Do: Name, City"
-                to_match = to_pattern.search(detail_line) or polish_to_pattern.search(detail_line)
+                to_match = (_TO_RE.search(detail_line) or _POLISH_TO_RE.search(detail_line)) if 'to' in labels else None
                 if to_match:
                     to_value = to_match.group(1).strip()
                     # Try to extract IBAN from "NAME, IBAN" format
-                    iban_match = iban_in_address_pattern.match(to_value)
+                    iban_match = _IBAN_IN_ADDRESS_RE.match(to_value)
                     if iban_match:
                         txn_info.counterparty_name = iban_match.group(1).strip()
                         txn_info.counterparty_iban = iban_match.group(2)
                     else:
                         # Try to extract BBAN from "NAME, 26-digit" format (Polish)
-                        bban_match = bban_in_address_pattern.match(to_value)
+                        bban_match = _BBAN_IN_ADDRESS_RE.match(to_value)
                         if bban_match:
                             txn_info.counterparty_name = bban_match.group(1).strip()
                             txn_info.counterparty_bban = bban_match.group(2)
@@ -446,7 +625,7 @@ def parse_pdf(pdf_path: str) -> Dict[str, PdfCurrencySection]:
                 
                 # Check for From:/Od: (source card or sender info)
                 # Format: "From: *6671" or "Od: NAME, IBAN"
-                from_match = from_pattern.search(detail_line) or polish_from_pattern.search(detail_line)
+                from_match = (_FROM_RE.search(detail_line) or _POLISH_FROM_RE.search(detail_line)) if 'from' in labels else None
                 if from_match:
                     from_value = from_match.group(1).strip()
                     # If it's a card reference (like *6671), store as source_card
@@ -454,13 +633,13 @@ def parse_pdf(pdf_path: str) -> Dict[str, PdfCurrencySection]:
                         txn_info.source_card = from_value
                     else:
                         # Try to extract IBAN from "NAME, IBAN" format
-                        iban_match = iban_in_address_pattern.match(from_value)
+                        iban_match = _IBAN_IN_ADDRESS_RE.match(from_value)
                         if iban_match:
                             txn_info.counterparty_name = iban_match.group(1).strip()
                             txn_info.counterparty_iban = iban_match.group(2)
                         else:
                             # Try to extract BBAN from "NAME, 26-digit" format
-                            bban_match = bban_in_address_pattern.match(from_value)
+                            bban_match = _BBAN_IN_ADDRESS_RE.match(from_value)
                             if bban_match:
                                 txn_info.counterparty_name = bban_match.group(1).strip()
                                 txn_info.counterparty_bban = bban_match.group(2)
@@ -470,25 +649,25 @@ def parse_pdf(pdf_path: str) -> Dict[str, PdfCurrencySection]:
                                     txn_info.counterparty_address = from_value
                 
                 # Check for Revolut Rate (English) or Kurs Revolut (Polish)
-                rate_match = re.search(r'Revolut Rate\s+(.+?)\s*\(ECB', detail_line)
+                rate_match = _RATE_RE.search(detail_line) if 'rate' in labels else None
                 if rate_match:
                     txn_info.exchange_rate = rate_match.group(1).strip()
                 
                 # Polish exchange rate: "Kurs Revolut: 1.00 PLN = 5.84 CZK (kurs ECB*: ...)"
-                polish_rate_match = re.search(r'Kurs Revolut:\s*(.+?)\s*\(kurs ECB', detail_line, re.IGNORECASE)
+                polish_rate_match = _POLISH_RATE_RE.search(detail_line) if 'polish_rate' in labels else None
                 if polish_rate_match:
                     txn_info.exchange_rate = polish_rate_match.group(1).strip()
                     # Polish format has original amount at end of line: "566.26 CZK"
-                    orig_at_end = re.search(r'([\d,.]+)\s+([A-Z]{3})\s*$', detail_line)
+                    orig_at_end = _tail_amount_currency(detail_line)
                     if orig_at_end:
-                        amount = orig_at_end.group(1).replace(',', '')
-                        currency = orig_at_end.group(2)
+                        amount, currency = orig_at_end
+                        amount = amount.replace(',', '')
                         if currency != 'PLN':  # Only if it's not the local currency
                             txn_info.original_amount = amount
                             txn_info.original_currency = currency
                 
                 # Check for original currency amount (€4.43, $100.00) on its own line
-                orig_match = orig_currency_pattern.match(detail_line)
+                orig_match = _ORIG_CURRENCY_RE.match(detail_line)
                 if orig_match:
                     symbol = orig_match.group(1)
                     amount = orig_match.group(2)
@@ -503,9 +682,9 @@ def parse_pdf(pdf_path: str) -> Dict[str, PdfCurrencySection]:
                 # Also check for original amount on Revolut Rate line
                 # Format 1: "Revolut Rate $1.00 = €0.97 (ECB rate...)   €17.00"
                 # Format 2: "Revolut Rate $1.00 = 4.13 PLN (ECB rate...)   34.99 PLN"
-                if not txn_info.original_amount and 'Revolut Rate' in detail_line:
+                if not txn_info.original_amount and 'rate' in labels:
                     # Try symbol format first (€17.00)
-                    inline_orig = re.search(r'([€$£])([0-9,.]+)\s*$', detail_line)
+                    inline_orig = _TRAILING_SYMBOL_AMOUNT_RE.search(detail_line)
                     if inline_orig:
                         symbol = inline_orig.group(1)
                         txn_info.original_amount = inline_orig.group(2)
@@ -517,32 +696,54 @@ def parse_pdf(pdf_path: str) -> Dict[str, PdfCurrencySection]:
                             txn_info.original_currency = 'GBP'
                     else:
                         # Try code format (34.99 PLN)
-                        code_orig = re.search(r'([0-9,.]+)\s+([A-Z]{3})\s*$', detail_line)
+                        code_orig = _tail_amount_currency(detail_line)
                         if code_orig:
-                            txn_info.original_amount = code_orig.group(1).replace(',', '')
-                            txn_info.original_currency = code_orig.group(2)
+                            txn_info.original_amount = code_orig[0].replace(',', '')
+                            txn_info.original_currency = code_orig[1]
                 
                 j += 1
             
-            # Use detected_currency to select/create section
-            if detected_currency:
-                if detected_currency not in sections:
-                    sections[detected_currency] = PdfCurrencySection(
-                        currency=detected_currency,
-                        filename=os.path.basename(pdf_path),
-                        ibans=global_ibans.copy()
-                    )
-                target_section = sections[detected_currency]
-                target_section.transactions.append(txn_info)
-            elif current_section:
-                # Fallback to current section if no currency detected
-                current_section.transactions.append(txn_info)
+            target_section.transactions.append(txn_info)
         
         i += 1
     
     return sections
 
 
+def _parse_pdf_or_error(
+    pdf_path: str,
+    wanted_currencies: Optional[Set[str]] = None,
+    use_pymupdf: bool = False,
+) -> Union[Dict[str, PdfCurrencySection], Exception]:
+    """Parse one PDF, returning the error instead of raising it."""
+    try:
+        return parse_pdf(pdf_path, wanted_currencies, use_pymupdf)
+    except Exception as e:
+        return e
+
+
+def parse_pdf_files(
+    pdf_paths: List[str],
+    wanted_currencies: Optional[List[Optional[Set[str]]]] = None,
+    use_pymupdf: bool = False,
+) -> List[Union[Dict[str, PdfCurrencySection], Exception]]:
+    """Parse several PDF statements, using worker processes when worthwhile.
+    
+    Args:
+        pdf_paths: Paths to the PDF statements.
+        wanted_currencies: Optional per-path wanted_currencies for parse_pdf.
+        use_pymupdf: Extract the text with PyMuPDF instead of pdftotext.
+    
+    Returns:
+        For each path in input order, the parse_pdf result or the exception
+        it raised.
+    """
+    if wanted_currencies is None:
+        wanted_currencies = [None] * len(pdf_paths)
+    return map_files(_parse_pdf_or_error, pdf_paths, wanted_currencies,
+                     [use_pymupdf] * len(pdf_paths))
+
+
 def detect_csv_format(path: str) -> str:
     """Detect CSV format based on header.
     
@@ -560,57 +761,110 @@ def detect_csv_format(path: str) -> str:
         raise ValueError(f"Unknown CSV format: {header}")
 
 
-def parse_credit_card_csv(path: str, account_type: str = 'creditcard') -> CsvStatementInfo:
-    """Parse credit card CSV (7 columns).
+# Read buffer for statement CSVs, which can run to many megabytes
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Columns read from the CSV files, in the order _iter_csv_transactions unpacks
+# them.  Credit card CSVs lack Product, Currency and State, which read as ''.
+_CSV_COLUMNS = (
+    'Type', 'Product', 'Started Date', 'Completed Date', 'Description',
+    'Amount', 'Fee', 'Currency', 'State', 'Balance')
+
+
+def _iter_csv_rows(
+    f,
+    columns: Sequence[str],
+) -> Iterator[Tuple[int, Tuple[str, ...]]]:
+    """Yield (line number, cells) for each data row of a CSV file.
     
-    Format: Type,Started Date,Completed Date,Description,Amount,Fee,Balance
+    The header is read once to find `columns`, so reordered or extra columns
+    still work; cells come back in `columns` order.  Missing columns and
+    cells read as ''.  Blank rows are skipped and not counted, as with
+    csv.DictReader.
     """
-    transactions: List[RevolutTransaction] = []
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    # Missing columns point at a padding cell past the end of the row
+    width = len(header) + 1
+    get_cells = operator.itemgetter(
+        *(header.index(name) if name in header else width - 1 for name in columns))
+    padding = [''] * width
+    for line_num, row in enumerate(filter(None, reader), start=2):
+        if len(row) < width:
+            row += padding[len(row):]
+        yield line_num, get_cells(row)
+
+
+def _parse_csv_dates(
+    started_date_raw: str,
+    completed_date_raw: Optional[str],
+) -> Optional[Tuple[datetime.date, Optional[datetime.date], str, Optional[str]]]:
+    """Parse the started/completed cells of a CSV row.
     
-    with open(path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for line_num, row in enumerate(reader, start=2):
-            if not row.get('Started Date'):
+    Returns:
+        (started_date, completed_date, started_date_raw, completed_date_raw),
+        or None if the row has no valid started date.
+    """
+    started_date_raw = started_date_raw.strip()
+    try:
+        started_date = parse_revolut_date(started_date_raw)
+    except ValueError:
+        return None
+    
+    completed_date = None
+    completed_date_raw = completed_date_raw.strip() if completed_date_raw else None
+    if completed_date_raw is not None:
+        try:
+            completed_date = parse_revolut_date(completed_date_raw)
+        except ValueError:
+            pass
+    return started_date, completed_date, started_date_raw, completed_date_raw
+
+
+def _iter_csv_transactions(path: str) -> Iterator[RevolutTransaction]:
+    """Yield the transactions of a credit card or regular account CSV."""
+    with open(path, 'r', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as f:
+        for line_num, (txn_type, product, started, completed, description, amount,
+                       fee, currency, state, balance) in _iter_csv_rows(f, _CSV_COLUMNS):
+            if not started:
                 continue
             
-            started_date_raw = row['Started Date'].strip()
-            try:
-                started_date = parse_revolut_date(started_date_raw)
-            except ValueError:
+            dates = _parse_csv_dates(started, completed)
+            if dates is None:
                 continue
+            started_date, completed_date, started_date_raw, completed_date_raw = dates
             
-            completed_date = None
-            completed_date_raw = None
-            if row.get('Completed Date'):
-                completed_date_raw = row['Completed Date'].strip()
-                try:
-                    completed_date = parse_revolut_date(completed_date_raw)
-                except ValueError:
-                    pass
-            
-            txn = RevolutTransaction(
-                transaction_type=row.get('Type', '').strip(),
+            # Currency, type, product and state are interned: a handful of
+            # values repeat on every row
+            yield RevolutTransaction(
+                transaction_type=sys.intern(txn_type.strip()),
                 started_date=started_date,
                 completed_date=completed_date,
                 started_date_raw=started_date_raw,
                 completed_date_raw=completed_date_raw,
-                description=row.get('Description', '').strip(),
-                amount=parse_revolut_amount(row.get('Amount', '')),
-                fee=parse_revolut_amount(row.get('Fee', '')),
-                balance_after=parse_revolut_amount(row.get('Balance', '')),
-                currency='PLN',  # Credit card is always PLN
-                product=None,
-                state=None,
+                description=description.strip(),
+                amount=parse_revolut_amount(amount),
+                fee=parse_revolut_amount(fee),
+                balance_after=parse_revolut_amount(balance),
+                currency=sys.intern(currency.strip()) or 'PLN',
+                product=sys.intern(product.strip()) or None,
+                state=sys.intern(state.strip()) or None,
                 line_number=line_num,
             )
-            transactions.append(txn)
+
+
+def parse_credit_card_csv(path: str, account_type: str = 'creditcard') -> CsvStatementInfo:
+    """Parse credit card CSV (7 columns).
     
+    Format: Type,Started Date,Completed Date,Description,Amount,Fee,Balance
+    """
     return CsvStatementInfo(
         filename=path,
         account_type=account_type,
-        currency='PLN',
-        transactions=transactions,
+        currency='PLN',  # Credit card is always PLN
+        transactions=list(_iter_csv_transactions(path)),
     )
 
 
@@ -622,49 +876,10 @@ def parse_account_csv(path: str, account_type: str = 'personal') -> List[CsvStat
     Returns:
         List of CsvStatementInfo, one per currency found in the CSV.
     """
+    # Bucket rows by currency as they are read
     transactions_by_currency: Dict[str, List[RevolutTransaction]] = {}
-    
-    with open(path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for line_num, row in enumerate(reader, start=2):
-            if not row.get('Started Date'):
-                continue
-            
-            started_date_raw = row['Started Date'].strip()
-            try:
-                started_date = parse_revolut_date(started_date_raw)
-            except ValueError:
-                continue
-            
-            completed_date = None
-            completed_date_raw = None
-            if row.get('Completed Date'):
-                completed_date_raw = row['Completed Date'].strip()
-                try:
-                    completed_date = parse_revolut_date(completed_date_raw)
-                except ValueError:
-                    pass
-            
-            currency = row.get('Currency', 'PLN').strip()
-            
-            txn = RevolutTransaction(
-                transaction_type=row.get('Type', '').strip(),
-                started_date=started_date,
-                completed_date=completed_date,
-                started_date_raw=started_date_raw,
-                completed_date_raw=completed_date_raw,
-                description=row.get('Description', '').strip(),
-                amount=parse_revolut_amount(row.get('Amount', '')),
-                fee=parse_revolut_amount(row.get('Fee', '')),
-                balance_after=parse_revolut_amount(row.get('Balance', '')),
-                currency=currency,
-                product=row.get('Product', '').strip() or None,
-                state=row.get('State', '').strip() or None,
-                line_number=line_num,
-            )
-            
-            transactions_by_currency.setdefault(currency, []).append(txn)
+    for txn in _iter_csv_transactions(path):
+        transactions_by_currency.setdefault(txn.currency, []).append(txn)
     
     result = []
     for currency, txns in transactions_by_currency.items():
@@ -678,33 +893,148 @@ def parse_account_csv(path: str, account_type: str = 'personal') -> List[CsvStat
     return result
 
 
+_ONE_DAY = datetime.timedelta(days=1)
+
+# PdfTransactionInfo fields copied onto the matched CSV transaction when set
+_ENRICH_FIELDS = (
+    'reference', 'counterparty_name', 'counterparty_iban', 'counterparty_bban',
+    'counterparty_address', 'card_number', 'source_card', 'original_amount',
+    'original_currency', 'exchange_rate')
+
+
+def _description_keys(description: str) -> Tuple[str, str]:
+    """Return the lowercased first and second words of a description ('' if absent)."""
+    words = description.split()
+    first = words[0].lower() if words else ''
+    second = words[1].lower() if len(words) > 1 else ''
+    return first, second
+
+
+def _score_pdf_match(
+    csv_keys: Tuple[str, str],
+    csv_desc_upper: str,
+    pdf_keys: Tuple[str, str],
+    pdf_counterparty_upper: str,
+) -> int:
+    """Score how well a PDF transaction matches a CSV one; 0 means no match."""
+    score = 0
+    
+    # Check if description starts with same words
+    csv_first, csv_second = csv_keys
+    pdf_first, pdf_second = pdf_keys
+    if csv_first and csv_first == pdf_first:
+        score += 1
+        
+        # Check for second word match (e.g., "Payment from" both match)
+        if csv_second and csv_second == pdf_second:
+            score += 1
+    
+    # Try to match by counterparty name in description
+    # E.g., CSV "Payment from JOANNA MAZUR" should match PDF with counterparty_name "JOANNA MAZUR"
+    if pdf_counterparty_upper and pdf_counterparty_upper in csv_desc_upper:
+        score += 5  # Strong match
+    
+    return score
+
+
+class _PdfCandidateIndex:
+    """Per-section lookup of the PDF transactions a CSV transaction can match.
+    
+    Only PDF transactions sharing the CSV first word or whose counterparty
+    appears in the CSV description can score, so each day's transactions are
+    indexed by both, by position in the day.
+    """
+    
+    def __init__(self, section: PdfCurrencySection) -> None:
+        self.section = section
+        self.by_date = _pdf_transactions_by_date(section)
+        self.counterparty_by_txn: Dict[int, str] = {}
+        self.by_first: Dict[Tuple[datetime.date, str], List[int]] = {}
+        self.by_counterparty: Dict[datetime.date, List[Tuple[int, str]]] = {}
+        for day, day_txns in self.by_date.items():
+            for pos, pdf_txn in enumerate(day_txns):
+                first = pdf_txn.description_keys[0]
+                counterparty_upper = (pdf_txn.counterparty_name or '').upper()
+                self.counterparty_by_txn[id(pdf_txn)] = counterparty_upper
+                if first:
+                    self.by_first.setdefault((day, first), []).append(pos)
+                if counterparty_upper:
+                    self.by_counterparty.setdefault(day, []).append((pos, counterparty_upper))
+    
+    def best_match(
+        self,
+        day: datetime.date,
+        csv_keys: Tuple[str, str],
+        csv_desc_upper: str,
+    ) -> Optional[PdfTransactionInfo]:
+        """Return the best-scoring unmatched PDF transaction on `day`, if any."""
+        day_txns = self.by_date.get(day)
+        if not day_txns:
+            return None
+        candidates = set(self.by_first.get((day, csv_keys[0]), ()))
+        candidates.update(
+            pos for pos, counterparty_upper in self.by_counterparty.get(day, ())
+            if counterparty_upper in csv_desc_upper)
+        best_match = None
+        best_score = 0
+        # Visit in day order so ties go to the earlier transaction
+        for pos in sorted(candidates):
+            pdf_txn = day_txns[pos]
+            # Skip already matched transactions
+            if pdf_txn.matched:
+                continue
+            
+            score = _score_pdf_match(
+                csv_keys, csv_desc_upper,
+                pdf_txn.description_keys, self.counterparty_by_txn[id(pdf_txn)])
+            if score > best_score:
+                best_score = score
+                best_match = pdf_txn
+        return best_match
+    
+    def enrich(self, csv_txn: RevolutTransaction, pdf_txn: PdfTransactionInfo) -> None:
+        """Copy PDF data onto `csv_txn` and mark `pdf_txn` as used."""
+        # Mark as matched to prevent duplicate matching
+        pdf_txn.matched = True
+        
+        # Enrich CSV transaction with additional PDF data
+        # Copy PDF description (e.g., "Open banking top-up")
+        csv_txn.pdf_description = pdf_txn.description
+        # Track source PDF for document_2
+        csv_txn.pdf_filename = self.section.filename
+        for name in _ENRICH_FIELDS:
+            value = getattr(pdf_txn, name)
+            if value:
+                setattr(csv_txn, name, value)
+
+
 def match_csv_with_pdf(
     csv_statements: List[CsvStatementInfo],
     pdf_sections: Dict[str, PdfCurrencySection],
 ) -> None:
     """Enrich CSV transactions with PDF data by matching.
     
-    Matches are made by: date, description similarity, amount (when available).
+    Matches are made by: date (or a day either side), description similarity,
+    amount (when available).  Every transaction is first matched on its own
+    date; only those left unmatched then try the days either side, so they
+    never take a PDF entry that belongs to another transaction's exact date.
     Modifies csv_statements in place.
     """
+    indexes: Dict[str, _PdfCandidateIndex] = {}
+    # CSV transactions with no PDF entry on their own date
+    unmatched: List[Tuple[RevolutTransaction, _PdfCandidateIndex, Tuple[str, str], str]] = []
+    
     for csv_stmt in csv_statements:
         pdf_section = pdf_sections.get(csv_stmt.currency)
         if not pdf_section:
             continue
+        index = indexes.get(csv_stmt.currency)
+        if index is None:
+            index = indexes[csv_stmt.currency] = _PdfCandidateIndex(pdf_section)
         
         # Get IBANs from PDF section (apply to all transactions in this currency)
-        section_iban_lt = None
-        section_iban_pl = None
-        for iban in pdf_section.ibans:
-            if iban.startswith('LT'):
-                section_iban_lt = iban
-            elif iban.startswith('PL'):
-                section_iban_pl = iban
-        
-        # Build lookup of PDF transactions
-        pdf_by_date: Dict[datetime.date, List[PdfTransactionInfo]] = {}
-        for pdf_txn in pdf_section.transactions:
-            pdf_by_date.setdefault(pdf_txn.date, []).append(pdf_txn)
+        section_iban_lt = pdf_section.iban_lt
+        section_iban_pl = pdf_section.iban_pl
         
         for csv_txn in csv_stmt.transactions:
             # Always assign IBANs from section
@@ -715,76 +1045,23 @@ def match_csv_with_pdf(
             
             # Use completed_date for matching (that's what PDF shows)
             match_date = csv_txn.completed_date or csv_txn.started_date
+            csv_keys = _description_keys(csv_txn.description)
+            csv_desc_upper = csv_txn.description.upper()
             
-            pdf_candidates = pdf_by_date.get(match_date, [])
-            
-            # Find best match by description and amount
-            best_match = None
-            best_score = 0
-            best_match_idx = -1
-            
-            for idx, pdf_txn in enumerate(pdf_candidates):
-                # Skip already matched transactions
-                if getattr(pdf_txn, '_matched', False):
-                    continue
-                
-                score = 0
-                
-                # Check if description starts with same words
-                csv_desc_first = csv_txn.description.split()[0].lower() if csv_txn.description else ''
-                pdf_desc_words = pdf_txn.description.split() if pdf_txn.description else []
-                pdf_desc_first = pdf_desc_words[0].lower() if pdf_desc_words else ''
-                
-                if csv_desc_first and pdf_desc_first and csv_desc_first == pdf_desc_first:
-                    score += 1
-                    
-                    # Check for second word match (e.g., "Payment from" both match)
-                    if len(csv_txn.description.split()) > 1 and len(pdf_desc_words) > 1:
-                        csv_second = csv_txn.description.split()[1].lower()
-                        pdf_second = pdf_desc_words[1].lower()
-                        if csv_second == pdf_second:
-                            score += 1
-                
-                # Try to match by counterparty name in description
-                # E.g., CSV "Payment from JOANNA MAZUR" should match PDF with counterparty_name "JOANNA MAZUR"
-                if pdf_txn.counterparty_name and csv_txn.description:
-                    if pdf_txn.counterparty_name.upper() in csv_txn.description.upper():
-                        score += 5  # Strong match
-                
-                if score > best_score:
-                    best_score = score
-                    best_match = pdf_txn
-                    best_match_idx = idx
-            
-            if best_match and best_score > 0:
-                # Mark as matched to prevent duplicate matching
-                best_match._matched = True
-                
-                # Enrich CSV transaction with additional PDF data
-                # Copy PDF description (e.g., "Open banking top-up")
-                csv_txn.pdf_description = best_match.description
-                # Track source PDF for document_2
-                csv_txn.pdf_filename = pdf_section.filename
-                if best_match.reference:
-                    csv_txn.reference = best_match.reference
-                if best_match.counterparty_name:
-                    csv_txn.counterparty_name = best_match.counterparty_name
-                if best_match.counterparty_iban:
-                    csv_txn.counterparty_iban = best_match.counterparty_iban
-                if best_match.counterparty_bban:
-                    csv_txn.counterparty_bban = best_match.counterparty_bban
-                if best_match.counterparty_address:
-                    csv_txn.counterparty_address = best_match.counterparty_address
-                if best_match.card_number:
-                    csv_txn.card_number = best_match.card_number
-                if best_match.source_card:
-                    csv_txn.source_card = best_match.source_card
-                if best_match.original_amount:
-                    csv_txn.original_amount = best_match.original_amount
-                if best_match.original_currency:
-                    csv_txn.original_currency = best_match.original_currency
-                if best_match.exchange_rate:
-                    csv_txn.exchange_rate = best_match.exchange_rate
+            best_match = index.best_match(match_date, csv_keys, csv_desc_upper)
+            if best_match is not None:
+                index.enrich(csv_txn, best_match)
+            else:
+                unmatched.append((csv_txn, index, csv_keys, csv_desc_upper))
+    
+    # Second pass: the days either side, for what the exact dates left over
+    for csv_txn, index, csv_keys, csv_desc_upper in unmatched:
+        match_date = csv_txn.completed_date or csv_txn.started_date
+        for day in (match_date - _ONE_DAY, match_date + _ONE_DAY):
+            best_match = index.best_match(day, csv_keys, csv_desc_upper)
+            if best_match is not None:
+                index.enrich(csv_txn, best_match)
+                break
 
 
 def _generate_transaction_id(account_type: str, currency: str, txn: RevolutTransaction) -> str:
@@ -794,6 +1071,13 @@ def _generate_transaction_id(account_type: str, currency: str, txn: RevolutTrans
     return f"revolut:{hash_value}"
 
 
+def _transaction_id(account_type: str, txn: RevolutTransaction) -> str:
+    """Return the transaction ID, generating it only on first use."""
+    if txn.txn_id is None:
+        txn.txn_id = _generate_transaction_id(account_type, txn.currency, txn)
+    return txn.txn_id
+
+
 def get_info(filename: str) -> dict:
     """Create info dict for import result."""
     return dict(
@@ -802,7 +1086,7 @@ def get_info(filename: str) -> dict:
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RevolutFxPair:
     """Paired FX exchange transactions from Revolut."""
     date: datetime.date
@@ -812,6 +1096,18 @@ class RevolutFxPair:
     target_txn: RevolutTransaction
 
 
+# Description prefixes of internal Revolut operations
+_INTERNAL_PREFIXES = ('Credit card', 'Apple Pay', 'Exchanged')
+# ...and of transfers that are internal unless they name an external account
+_INTERNAL_TRANSFER_PREFIXES = ('To ', 'From ')
+
+# "Transfer to NAME", "Payment from NAME", etc.; group 1 is the counterparty
+_PAYEE_RE = re.compile(r'^(?:Transfer|Payment)\s+(?:to|from)\s+(.+)$', re.IGNORECASE)
+
+# Statement period in PDF filenames (e.g., account-statement_2025-01-01_2025-12-31_en_xxx.pdf)
+_DATE_RANGE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})_(\d{4}-\d{2}-\d{2})')
+
+
 class RevolutSource(Source):
     """Revolut CSV/PDF transaction source."""
 
@@ -819,6 +1115,7 @@ class RevolutSource(Source):
         self,
         directory: str,
         account_map: Dict[str, str],
+        use_pymupdf: bool = False,
         **kwargs,
     ) -> None:
         """Initialize the Revolut source.
@@ -827,15 +1124,21 @@ class RevolutSource(Source):
             directory: Directory containing subdirectories with CSV/PDF files.
             account_map: Dictionary mapping account_id (type_currency) to Beancount account.
                          Example: {'personal_PLN': 'Assets:Revolut:PLN'}
+            use_pymupdf: Extract PDF text with PyMuPDF instead of pdftotext.
         """
         super().__init__(**kwargs)
         self.data_directory = directory
         self.account_map: Dict[str, str] = account_map
+        self.use_pymupdf = use_pymupdf
         
         if not self.account_map:
             raise ValueError(
                 "RevolutSource requires 'account_map' to be specified."
             )
+        if use_pymupdf and fitz is None:
+            raise ValueError(
+                "RevolutSource 'use_pymupdf' requires PyMuPDF to be installed."
+            )
 
         self.statements: List[CsvStatementInfo] = []
         self.transactions: List[Tuple[CsvStatementInfo, RevolutTransaction]] = []
@@ -852,7 +1155,7 @@ class RevolutSource(Source):
         
         # Collect all CSV and PDF files
         csv_files: List[Tuple[str, str]] = []  # (path, account_type)
-        pdf_files: List[str] = []
+        pdf_files: List[Tuple[str, str]] = []  # (path, account_type)
         
         for root, dirs, files in os.walk(self.data_directory):
             # Determine account type from directory name
@@ -870,29 +1173,7 @@ class RevolutSource(Source):
                 elif filename.endswith('.json'):
                     pass  # Ignore JSON files
         
-        # Parse all PDFs first to build supplementary data - grouped by account_type
-        pdf_sections_by_account: Dict[str, Dict[str, PdfCurrencySection]] = {}
-        pdf_parsed_currencies: Dict[str, Set[str]] = {}  # per-file currencies for Document directives
-        for pdf_path, account_type in pdf_files:
-            try:
-                sections = parse_pdf(pdf_path)
-                pdf_parsed_currencies[pdf_path] = set(sections.keys())
-                if account_type not in pdf_sections_by_account:
-                    pdf_sections_by_account[account_type] = {}
-                
-                for currency, section in sections.items():
-                    if currency not in pdf_sections_by_account[account_type]:
-                        pdf_sections_by_account[account_type][currency] = section
-                    else:
-                        # Merge transactions from same account_type
-                        pdf_sections_by_account[account_type][currency].transactions.extend(section.transactions)
-                        for iban in section.ibans:
-                            if iban not in pdf_sections_by_account[account_type][currency].ibans:
-                                pdf_sections_by_account[account_type][currency].ibans.append(iban)
-            except Exception as e:
-                self.log_status(f'revolut: error parsing PDF {pdf_path}: {e}')
-        
-        # Parse all CSVs
+        # Parse all CSVs first: their currencies decide which PDF details are needed
         for csv_path, account_type in csv_files:
             try:
                 fmt = detect_csv_format(csv_path)
@@ -905,15 +1186,51 @@ class RevolutSource(Source):
             except Exception as e:
                 self.log_status(f'revolut: error parsing CSV {csv_path}: {e}')
         
+        csv_currencies_by_account: Dict[str, Set[str]] = {}
+        for stmt in self.statements:
+            csv_currencies_by_account.setdefault(stmt.account_type, set()).add(stmt.currency)
+        
+        # Parse all PDFs to build supplementary data - grouped by account_type
+        pdf_sections_by_account: Dict[str, Dict[str, PdfCurrencySection]] = {}
+        pdf_parsed_currencies: Dict[str, Set[str]] = {}  # per-file currencies for Document directives
+        pdf_results = parse_pdf_files(
+            [pdf_path for pdf_path, _ in pdf_files],
+            [csv_currencies_by_account.get(account_type, set())
+             for _, account_type in pdf_files],
+            self.use_pymupdf)
+        for (pdf_path, account_type), sections in zip(pdf_files, pdf_results):
+            if isinstance(sections, Exception):
+                self.log_status(f'revolut: error parsing PDF {pdf_path}: {sections}')
+                continue
+            pdf_parsed_currencies[pdf_path] = set(sections.keys())
+            if account_type not in pdf_sections_by_account:
+                pdf_sections_by_account[account_type] = {}
+            
+            for currency, section in sections.items():
+                if currency not in pdf_sections_by_account[account_type]:
+                    pdf_sections_by_account[account_type][currency] = section
+                else:
+                    # Merge transactions from same account_type
+                    merged = pdf_sections_by_account[account_type][currency]
+                    merged.transactions.extend(section.transactions)
+                    for iban in section.ibans:
+                        if iban not in merged.ibans:
+                            merged.ibans.append(iban)
+                    merged.iban_lt, merged.iban_pl = _split_ibans(merged.ibans)
+        
         # Enrich CSV transactions with PDF data - matching by account_type
+        statements_by_account: Dict[str, List[CsvStatementInfo]] = {}
         for stmt in self.statements:
-            pdf_sections = pdf_sections_by_account.get(stmt.account_type, {})
+            statements_by_account.setdefault(stmt.account_type, []).append(stmt)
+        for account_type, account_statements in statements_by_account.items():
+            pdf_sections = pdf_sections_by_account.get(account_type, {})
             if pdf_sections:
-                match_csv_with_pdf([stmt], pdf_sections)
+                match_csv_with_pdf(account_statements, pdf_sections)
         
-        # Build transaction list
+        # Build transaction list, generating each ID once up front
         for stmt in self.statements:
             for txn in stmt.transactions:
+                _transaction_id(stmt.account_type, txn)
                 self.transactions.append((stmt, txn))
         
         # Track all loaded files for Document directives
@@ -1008,16 +1325,15 @@ class RevolutSource(Source):
         desc_lower = desc.lower()
         has_external_account = txn.counterparty_iban or txn.counterparty_bban
         is_internal = (
-            desc.startswith('To ') and not has_external_account or  # Internal transfers
-            desc.startswith('Credit card') or
-            desc.startswith('Apple Pay') or
+            desc.startswith(_INTERNAL_PREFIXES) or
             'portfolio' in desc_lower or
-            desc.startswith('Exchanged') or
-            desc.startswith('From ') and not has_external_account or  # Internal from
             'plan fee' in desc_lower or  # Ultra plan fee, Premium plan fee, etc.
             'plan termination' in desc_lower or  # Plan termination refund
-            'refund' in desc_lower and not has_external_account or  # Other internal refunds
-            'fee' in desc_lower and not has_external_account  # Other internal fees
+            not has_external_account and (
+                desc.startswith(_INTERNAL_TRANSFER_PREFIXES) or  # Internal to/from
+                'refund' in desc_lower or  # Other internal refunds
+                'fee' in desc_lower  # Other internal fees
+            )
         )
         
         # Determine payee and narration based on transaction type
@@ -1041,16 +1357,10 @@ class RevolutSource(Source):
             # "Payment to MERCHANT" -> "MERCHANT"
             extracted_payee = None
             
-            # Check for Transfer to/from pattern
-            transfer_match = re.match(r'^Transfer\s+(?:to|from)\s+(.+)$', desc, re.IGNORECASE)
-            if transfer_match:
-                extracted_payee = transfer_match.group(1).strip()
-            
-            # Check for Payment to pattern
-            if not extracted_payee:
-                payment_match = re.match(r'^Payment\s+(?:to|from)\s+(.+)$', desc, re.IGNORECASE)
-                if payment_match:
-                    extracted_payee = payment_match.group(1).strip()
+            # Check for Transfer/Payment to/from pattern
+            payee_match = _PAYEE_RE.match(desc)
+            if payee_match:
+                extracted_payee = payee_match.group(1).strip()
             
             # Use counterparty_address as payee if it looks like a name (not an address)
             if not extracted_payee and txn.counterparty_address:
@@ -1073,10 +1383,9 @@ class RevolutSource(Source):
             narration = normalized_type
         
         # Build metadata
-        account_id = f"{statement.account_type}_{txn.currency}"
-        txn_id = _generate_transaction_id(statement.account_type, txn.currency, txn)
+        txn_id = _transaction_id(statement.account_type, txn)
         
-        meta = collections.OrderedDict()
+        meta = {}
         meta[SOURCE_REF_KEY] = txn_id
         meta[SOURCE_BANK_KEY] = 'Revolut'
         
@@ -1198,10 +1507,10 @@ class RevolutSource(Source):
         txn_date = txn.completed_date or txn.started_date
         
         return Transaction(
-            meta=collections.OrderedDict([
-                ('filename', statement.filename),
-                ('lineno', txn.line_number),
-            ]),
+            meta={
+                'filename': statement.filename,
+                'lineno': txn.line_number,
+            },
             date=txn_date,
             flag=FLAG_OKAY,
             payee=payee,
@@ -1233,9 +1542,8 @@ class RevolutSource(Source):
         exchange_txns: List[Tuple[CsvStatementInfo, RevolutTransaction, str]] = []
         for statement, txn in self.transactions:
             if txn.transaction_type == 'Exchange':
-                account_id = f"{statement.account_type}_{txn.currency}"
-                txn_id = _generate_transaction_id(statement.account_type, txn.currency, txn)
-                exchange_txns.append((statement, txn, txn_id))
+                exchange_txns.append(
+                    (statement, txn, _transaction_id(statement.account_type, txn)))
         
         # Group by started_date for efficient matching
         by_date: Dict[datetime.date, List[Tuple[CsvStatementInfo, RevolutTransaction, str]]] = {}
@@ -1311,15 +1619,15 @@ class RevolutSource(Source):
             unit_price = None
         
         # Source posting metadata
-        src_meta = collections.OrderedDict()
-        src_meta[SOURCE_REF_KEY] = _generate_transaction_id(
-            pair.source_statement.account_type, src_txn.currency, src_txn)
+        src_meta = {}
+        src_meta[SOURCE_REF_KEY] = _transaction_id(
+            pair.source_statement.account_type, src_txn)
         src_meta[SOURCE_BANK_KEY] = 'Revolut'
         
         # Target posting metadata  
-        tgt_meta = collections.OrderedDict()
-        tgt_meta[SOURCE_REF_KEY] = _generate_transaction_id(
-            pair.target_statement.account_type, tgt_txn.currency, tgt_txn)
+        tgt_meta = {}
+        tgt_meta[SOURCE_REF_KEY] = _transaction_id(
+            pair.target_statement.account_type, tgt_txn)
         tgt_meta[SOURCE_BANK_KEY] = 'Revolut'
         
         # Add common metadata to source posting
@@ -1336,10 +1644,10 @@ class RevolutSource(Source):
             src_meta[SOURCE_DOC_KEY] = os.path.basename(pair.source_statement.filename)
         
         return Transaction(
-            meta=collections.OrderedDict([
-                ('filename', pair.source_statement.filename),
-                ('lineno', src_txn.line_number),
-            ]),
+            meta={
+                'filename': pair.source_statement.filename,
+                'lineno': src_txn.line_number,
+            },
             date=pair.date,
             flag=FLAG_OKAY,
             payee='Revolut',
@@ -1374,19 +1682,13 @@ class RevolutSource(Source):
         """Prepare import results from loaded transactions."""
         all_accounts = self._get_all_accounts()
 
-        # Build set of already-matched transaction IDs
+        # Already-matched transaction IDs in our accounts.  The journal-wide
+        # ref index is built once and shared with other sources.
         matched_ids: Dict[str, List[Tuple[Transaction, Posting]]] = {}
-
-        for entry in journal.all_entries:
-            if isinstance(entry, Transaction):
-                for posting in entry.postings:
-                    if posting.meta is None:
-                        continue
-                    if posting.account not in all_accounts:
-                        continue
-                    ref = posting.meta.get(SOURCE_REF_KEY)
-                    if ref is not None:
-                        matched_ids.setdefault(ref, []).append((entry, posting))
+        for ref, pairs in journal.get_postings_by_ref(SOURCE_REF_KEY).items():
+            ours = [pair for pair in pairs if pair[1].account in all_accounts]
+            if ours:
+                matched_ids[ref] = ours
 
         # Track for balance assertions
         balances_by_account: Dict[str, List[Tuple[datetime.date, Decimal, str]]] = {}
@@ -1397,10 +1699,8 @@ class RevolutSource(Source):
         fx_pairs, fx_paired_ids = self._find_fx_pairs()
         
         for pair in fx_pairs:
-            src_id = _generate_transaction_id(
-                pair.source_statement.account_type, pair.source_txn.currency, pair.source_txn)
-            tgt_id = _generate_transaction_id(
-                pair.target_statement.account_type, pair.target_txn.currency, pair.target_txn)
+            src_id = _transaction_id(pair.source_statement.account_type, pair.source_txn)
+            tgt_id = _transaction_id(pair.target_statement.account_type, pair.target_txn)
             valid_ids.add(src_id)
             valid_ids.add(tgt_id)
             
@@ -1446,8 +1746,7 @@ class RevolutSource(Source):
 
         # Process remaining (non-FX-paired) transactions
         for statement, txn in self.transactions:
-            account_id = f"{statement.account_type}_{txn.currency}"
-            txn_id = _generate_transaction_id(statement.account_type, txn.currency, txn)
+            txn_id = _transaction_id(statement.account_type, txn)
             valid_ids.add(txn_id)
             
             # Skip transactions already handled as FX pairs
@@ -1460,6 +1759,7 @@ class RevolutSource(Source):
                     results.add_invalid_reference(
                         InvalidSourceReference(len(existing) - 1, existing))
             else:
+                account_id = f"{statement.account_type}_{txn.currency}"
                 target_account = self._get_account_for_id(account_id)
                 if target_account is None:
                     continue
@@ -1492,13 +1792,13 @@ class RevolutSource(Source):
             balance_amount, currency, src_filename = latest_by_date[latest_date]
             
             balance_entry = Balance(
-                meta=collections.OrderedDict([
-                    ('filename', '<revolut>'),
-                    ('lineno', 0),
-                    ('source', 'revolut'),
-                    ('document', os.path.basename(src_filename)),
-                    ('balance_date', str(latest_date)),
-                ]),
+                meta={
+                    'filename': '<revolut>',
+                    'lineno': 0,
+                    'source': 'revolut',
+                    'document': os.path.basename(src_filename),
+                    'balance_date': str(latest_date),
+                },
                 date=latest_date + datetime.timedelta(days=1),
                 account=account,
                 amount=Amount(balance_amount, currency),
@@ -1528,17 +1828,24 @@ class RevolutSource(Source):
             if statement.filename not in file_max_dates or txn_date > file_max_dates[statement.filename]:
                 file_max_dates[statement.filename] = txn_date
         
-        # Try to extract date from PDF filenames (e.g., account-statement_2025-01-01_2025-12-31_en_xxx.pdf)
-        date_range_pattern = re.compile(r'(\d{4}-\d{2}-\d{2})_(\d{4}-\d{2}-\d{2})')
-        
         for filepath, account_type, currencies in self._loaded_files:
+            # Generate a Document for the first mapped account for this file
+            # (each file is associated with one account_type, pick the first matching currency)
+            target_account = None
+            for currency in currencies:
+                target_account = self._get_account_for_id(f"{account_type}_{currency}")
+                if target_account is not None:
+                    break
+            if target_account is None:
+                continue  # No mapped account — skip
+            
             doc_basename = os.path.basename(filepath)
             
             # Determine document date
             doc_date = file_max_dates.get(filepath)
             if doc_date is None:
                 # Try to extract end date from filename
-                m = date_range_pattern.search(doc_basename)
+                m = _DATE_RANGE_RE.search(doc_basename)
                 if m:
                     doc_date = datetime.date.fromisoformat(m.group(2))
                 else:
@@ -1550,33 +1857,25 @@ class RevolutSource(Source):
             else:
                 content_type = 'text/csv'
             
-            # Generate a Document for the first mapped account for this file
-            # (each file is associated with one account_type, pick the first matching currency)
-            for currency in currencies:
-                account_id = f"{account_type}_{currency}"
-                target_account = self._get_account_for_id(account_id)
-                if target_account is None:
-                    continue
-                
-                results.add_pending_entry(
-                    ImportResult(
-                        date=doc_date,
-                        entries=[
-                            Document(
-                                meta=None,
-                                date=doc_date,
-                                account=target_account,
-                                filename=filepath,  # Absolute path
-                                tags=EMPTY_SET,
-                                links=EMPTY_SET,
-                            )
-                        ],
-                        info=dict(
-                            type=content_type,
-                            filename=doc_basename,
-                        ),
-                    ))
-                break  # One Document per file (not per currency)
+            # One Document per file (not per currency)
+            results.add_pending_entry(
+                ImportResult(
+                    date=doc_date,
+                    entries=[
+                        Document(
+                            meta=None,
+                            date=doc_date,
+                            account=target_account,
+                            filename=filepath,  # Absolute path
+                            tags=EMPTY_SET,
+                            links=EMPTY_SET,
+                        )
+                    ],
+                    info=dict(
+                        type=content_type,
+                        filename=doc_basename,
+                    ),
+                ))
 
 
 def load(spec: dict, log_status):
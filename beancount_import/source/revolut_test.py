@@ -28,6 +28,11 @@ class TestParseRevolutDate:
         """Invalid date raises ValueError."""
         with pytest.raises(ValueError):
             revolut.parse_revolut_date('invalid')
+    
+    def test_invalid_time(self):
+        """Out-of-range time raises ValueError."""
+        with pytest.raises(ValueError):
+            revolut.parse_revolut_date('2025-01-02 25:00:00')
 
 
 class TestParseRevolutAmount:
@@ -47,6 +52,160 @@ class TestParseRevolutAmount:
         """Empty string returns ZERO."""
         result = revolut.parse_revolut_amount('')
         assert result == Decimal('0')
+    
+    def test_thousands_separator(self):
+        """Commas are thousands separators."""
+        result = revolut.parse_revolut_amount('1,000.00')
+        assert result == Decimal('1000.00')
+    
+    def test_invalid_amount(self):
+        """Unparseable amount raises ValueError."""
+        with pytest.raises(ValueError):
+            revolut.parse_revolut_amount('n/a')
+
+
+class TestExtractPdfText:
+    """Tests for extract_pdf_text and its helpers."""
+    
+    def test_words_to_lines_joins_table_row(self):
+        """Words on the same row are joined left to right."""
+        words = [
+            (300, 100.5, 340, 110.5, '-1.00', 0, 1, 0),
+            (10, 100, 60, 110, 'Jan', 0, 0, 0),
+            (65, 100, 80, 110, '3,', 0, 0, 1),
+            (85, 100, 115, 110, '2025', 0, 0, 2),
+            (150, 100, 200, 110, 'Allegro', 0, 0, 3),
+            (150, 112, 200, 122, 'Card:', 1, 0, 0),
+        ]
+        assert revolut._words_to_lines(words) == [
+            'Jan 3, 2025 Allegro -1.00',
+            'Card:',
+        ]
+    
+    def test_uses_pdftotext_by_default(self, monkeypatch):
+        """pdftotext is used unless PyMuPDF is requested, even if installed."""
+        monkeypatch.setattr(revolut, 'fitz', mock.Mock())
+        with mock.patch.object(revolut.subprocess, 'run') as run:
+            run.return_value.stdout = 'PLN Statement\n'
+            assert revolut.extract_pdf_text('statement.pdf') == 'PLN Statement\n'
+        assert run.call_args[0][0] == [
+            'pdftotext', '-layout', 'statement.pdf', '-']
+        assert not revolut.fitz.open.called
+    
+    def test_use_pymupdf_requires_pymupdf(self, monkeypatch):
+        """Requesting PyMuPDF without it installed is an error."""
+        monkeypatch.setattr(revolut, 'fitz', None)
+        with pytest.raises(RuntimeError):
+            revolut.extract_pdf_text('statement.pdf', use_pymupdf=True)
+        with pytest.raises(ValueError):
+            revolut.RevolutSource(
+                directory='/nonexistent', account_map={'personal_PLN': 'Assets:R'},
+                use_pymupdf=True, log_status=lambda x: None)
+
+
+SAMPLE_PDF_TEXT = """\
+IBAN LT133250085489069781                BIC REVOLT21
+IBAN PL12249000050000460012345678        BIC REVOPLPW
+
+PLN Statement
+Jan 6, 2025     Trading 212                              627.36 PLN        224.44 PLN
+                Card: 516794******6712
+                To: Trading 212, London, 7NA
+                Revolut Rate 1.00 PLN = $0.24 (ECB rate 1.00 PLN = $0.2401)    $151.05
+Jan 7, 2025     Payment from JOANNA MAZUR                  100.00 PLN      324.44 PLN
+                From: JOANNA MAZUR, PL61109010140000071219812874
+                Reference: Zwrot za obiad
+5 lut 2025      Booking.com                              566.26 PLN
+                Kurs Revolut: 1.00 PLN = 5.84 CZK (kurs ECB*: 1.00 PLN = 5.85 CZK)   3,306.96 CZK
+"""
+
+
+class TestParsePdf:
+    """Tests for parse_pdf function."""
+    
+    @pytest.fixture
+    def sections(self):
+        with mock.patch.object(revolut, 'extract_pdf_text', return_value=SAMPLE_PDF_TEXT):
+            return revolut.parse_pdf('/statements/stmt.pdf')
+    
+    def test_sections_and_ibans(self, sections):
+        assert list(sections) == ['PLN']
+        section = sections['PLN']
+        assert section.filename == 'stmt.pdf'
+        assert section.ibans == ['LT133250085489069781', 'PL12249000050000460012345678']
+        assert [t.date for t in section.transactions] == [
+            datetime.date(2025, 1, 6), datetime.date(2025, 1, 7), datetime.date(2025, 2, 5)]
+    
+    def test_card_payment_details(self, sections):
+        txn = sections['PLN'].transactions[0]
+        assert txn.description == 'Trading 212'
+        assert txn.card_number == '516794******6712'
+        assert txn.counterparty_address == 'Trading 212, London, 7NA'
+        assert txn.exchange_rate == '1.00 PLN = $0.24'
+        assert (txn.original_amount, txn.original_currency) == ('151.05', 'USD')
+    
+    def test_transfer_details(self, sections):
+        txn = sections['PLN'].transactions[1]
+        assert txn.counterparty_name == 'JOANNA MAZUR'
+        assert txn.counterparty_iban == 'PL61109010140000071219812874'
+        assert txn.reference == 'Zwrot za obiad'
+    
+    def test_polish_rate_details(self, sections):
+        txn = sections['PLN'].transactions[2]
+        assert txn.description == 'Booking.com'
+        assert txn.exchange_rate == '1.00 PLN = 5.84 CZK'
+        assert (txn.original_amount, txn.original_currency) == ('3306.96', 'CZK')
+    
+    def test_unwanted_currency_skipped(self):
+        """Sections outside wanted_currencies are returned without transactions."""
+        with mock.patch.object(revolut, 'extract_pdf_text', return_value=SAMPLE_PDF_TEXT):
+            sections = revolut.parse_pdf('/statements/stmt.pdf', wanted_currencies={'EUR'})
+        assert list(sections) == ['PLN']
+        assert sections['PLN'].transactions == []
+
+
+class TestLooksLikeAmount:
+    """Tests for _looks_like_amount function."""
+    
+    @pytest.mark.parametrize('word,expected', [
+        ('1,000.00', True),
+        ('12.50', True),
+        (',.12', True),
+        ('.12', False),
+        ('12.5', False),
+        ('12.500', False),
+        ('1a.00', False),
+    ])
+    def test_looks_like_amount(self, word, expected):
+        assert revolut._looks_like_amount(word) == expected
+
+
+class TestTailAmountCurrency:
+    """Tests for _tail_amount_currency function."""
+    
+    @pytest.mark.parametrize('line,expected', [
+        ('Kurs Revolut: 1.00 PLN = 5.84 CZK (kurs ECB*: x)   3,306.96 CZK  ', ('3,306.96', 'CZK')),
+        ('Revolut Rate $1.00 = 4.13 PLN (ECB rate)   x34.99 PLN', ('34.99', 'PLN')),
+        ('34.99 Pln', None),
+        ('34.99 PLNX', None),
+        ('rate PLN', None),
+        ('PLN', None),
+    ])
+    def test_tail_amount_currency(self, line, expected):
+        assert revolut._tail_amount_currency(line) == expected
+
+
+class TestParsePdfFiles:
+    """Tests for parse_pdf_files function."""
+    
+    @pytest.mark.parametrize('num_files', [1, 5])
+    def test_returns_errors_in_order(self, num_files):
+        """Unreadable PDFs yield their exception instead of aborting the batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, f'missing{i}.pdf') for i in range(num_files)]
+            results = revolut.parse_pdf_files(paths)
+        assert len(results) == num_files
+        assert all(isinstance(result, Exception) for result in results)
 
 
 class TestDetectCsvFormat:
@@ -96,6 +255,25 @@ CARD_PAYMENT,2025-01-02 18:24:10,2025-01-03 16:46:55,Allegro,-1.00,0.00,-1.00
         assert txn.description == 'Credit card repayment'
         assert txn.amount == Decimal('137.69')
         assert txn.completed_date == datetime.date(2025, 1, 2)
+    
+    def test_columns_located_by_header(self):
+        """Columns are found by name, so their order does not matter."""
+        csv_content = """Started Date,Type,Description,Completed Date,Amount,Balance,Fee
+
+2025-01-02 18:24:10,CARD_PAYMENT,Allegro,,-1.00,-1.00,0.00
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            f.flush()
+            result = revolut.parse_credit_card_csv(f.name)
+        os.unlink(f.name)
+        
+        txn, = result.transactions
+        assert txn.transaction_type == 'CARD_PAYMENT'
+        assert txn.description == 'Allegro'
+        assert txn.completed_date is None
+        assert txn.balance_after == Decimal('-1.00')
+        assert txn.line_number == 2
 
 
 class TestParseAccountCsv:
@@ -126,6 +304,24 @@ Transfer,Current,2025-10-08 20:19:48,2025-10-08 20:19:48,Exchanged to EUR,23.36,
         assert pln_txn.amount == Decimal('-627.36')
 
 
+class TestPdfTransactionsByDate:
+    """Tests for the per-section PDF date index."""
+    
+    def test_indexes_appended_transactions(self):
+        def pdf_txn(day):
+            return revolut.PdfTransactionInfo(
+                date=datetime.date(2025, 1, day), description='X', amount=None)
+        section = revolut.PdfCurrencySection(currency='PLN', transactions=[pdf_txn(1)])
+        
+        by_date = revolut._pdf_transactions_by_date(section)
+        assert list(by_date) == [datetime.date(2025, 1, 1)]
+        
+        section.transactions.extend([pdf_txn(1), pdf_txn(2)])
+        by_date = revolut._pdf_transactions_by_date(section)
+        assert {d: len(txns) for d, txns in by_date.items()} == {
+            datetime.date(2025, 1, 1): 2, datetime.date(2025, 1, 2): 1}
+
+
 class TestMatchCsvWithPdf:
     """Tests for match_csv_with_pdf function."""
     
@@ -178,6 +374,119 @@ class TestMatchCsvWithPdf:
         assert csv_txn.card_number == '516794******6712'
         assert csv_txn.counterparty_address == 'Trading 212, London, 7NA'
         assert csv_txn.exchange_rate == '1.00 PLN = $0.24'
+    
+    def test_match_adjacent_day_when_no_exact_date(self):
+        """A PDF entry a day off matches only if the exact date has none."""
+        def csv_txn(day):
+            return revolut.RevolutTransaction(
+                transaction_type='Card Payment',
+                started_date=datetime.date(2025, 1, day),
+                completed_date=datetime.date(2025, 1, day),
+                description='Allegro',
+                amount=Decimal('-1.00'),
+                fee=Decimal('0'),
+                balance_after=Decimal('0'),
+                currency='PLN',
+                product='Current',
+                state='COMPLETED',
+                line_number=2,
+            )
+        csv_txns = [csv_txn(6), csv_txn(8)]
+        csv_stmt = revolut.CsvStatementInfo(
+            filename='test.csv',
+            account_type='personal',
+            currency='PLN',
+            transactions=csv_txns,
+        )
+        pdf_section = revolut.PdfCurrencySection(
+            currency='PLN',
+            transactions=[
+                revolut.PdfTransactionInfo(
+                    date=datetime.date(2025, 1, 7), description='Allegro',
+                    amount=None, card_number='7'),
+                revolut.PdfTransactionInfo(
+                    date=datetime.date(2025, 1, 8), description='Allegro',
+                    amount=None, card_number='8'),
+            ],
+        )
+        
+        revolut.match_csv_with_pdf([csv_stmt], {'PLN': pdf_section})
+        
+        assert [t.card_number for t in csv_txns] == ['7', '8']
+    
+    def test_adjacent_day_does_not_take_exact_match(self):
+        """A row without a PDF entry on its date leaves the next day's entry to that day's row."""
+        def csv_txn(day):
+            return revolut.RevolutTransaction(
+                transaction_type='Transfer',
+                started_date=datetime.date(2025, 1, day),
+                completed_date=datetime.date(2025, 1, day),
+                description='Transfer to JAN KOWALSKI',
+                amount=Decimal('-1.00'),
+                fee=Decimal('0'),
+                balance_after=Decimal('0'),
+                currency='PLN',
+                product='Current',
+                state='COMPLETED',
+                line_number=2,
+            )
+        a, b = csv_txn(10), csv_txn(11)
+        csv_stmt = revolut.CsvStatementInfo(
+            filename='test.csv',
+            account_type='personal',
+            currency='PLN',
+            transactions=[a, b],
+        )
+        pdf_section = revolut.PdfCurrencySection(
+            currency='PLN',
+            transactions=[
+                revolut.PdfTransactionInfo(
+                    date=datetime.date(2025, 1, 11), description='Transfer to JAN KOWALSKI',
+                    amount=None, reference='rent-b'),
+            ],
+        )
+        
+        revolut.match_csv_with_pdf([csv_stmt], {'PLN': pdf_section})
+        
+        assert a.reference is None
+        assert b.reference == 'rent-b'
+    
+    def test_counterparty_match_beats_first_word(self):
+        """A counterparty found in the CSV description outweighs a first-word match."""
+        csv_txn = revolut.RevolutTransaction(
+            transaction_type='Transfer',
+            started_date=datetime.date(2025, 1, 7),
+            completed_date=datetime.date(2025, 1, 7),
+            description='Payment from JOANNA MAZUR',
+            amount=Decimal('100.00'),
+            fee=Decimal('0'),
+            balance_after=Decimal('0'),
+            currency='PLN',
+            product='Current',
+            state='COMPLETED',
+            line_number=2,
+        )
+        csv_stmt = revolut.CsvStatementInfo(
+            filename='test.csv',
+            account_type='personal',
+            currency='PLN',
+            transactions=[csv_txn],
+        )
+        pdf_section = revolut.PdfCurrencySection(
+            currency='PLN',
+            transactions=[
+                revolut.PdfTransactionInfo(
+                    date=datetime.date(2025, 1, 7), description='Payment from Jan',
+                    amount=None, reference='wrong'),
+                revolut.PdfTransactionInfo(
+                    date=datetime.date(2025, 1, 7), description='Przelew',
+                    amount=None, counterparty_name='Joanna Mazur', reference='right'),
+            ],
+        )
+        
+        revolut.match_csv_with_pdf([csv_stmt], {'PLN': pdf_section})
+        
+        assert csv_txn.reference == 'right'
 
 
 class TestRevolutSource:
@@ -211,3 +520,43 @@ class TestRevolutSource:
             
             assert source._get_account_for_id('personal_PLN') == 'Assets:Revolut:PLN'
             assert source._get_account_for_id('unknown_EUR') is None
+    
+    @pytest.mark.parametrize('description,counterparty_iban,expected_payee', [
+        ('Transfer to JAN KOWALSKI', 'PL61109010140000071219812874', 'JAN KOWALSKI'),
+        ('payment FROM Allegro ', None, 'Allegro'),
+        ('To EUR', None, 'Revolut'),
+        ('Premium plan fee', 'PL61109010140000071219812874', 'Revolut'),
+        ('Google Play', None, 'Google Play'),
+    ])
+    def test_make_transaction_payee(self, description, counterparty_iban, expected_payee):
+        """Payee comes from the description pattern, or is Revolut for internal operations."""
+        txn = revolut.RevolutTransaction(
+            transaction_type='Transfer',
+            started_date=datetime.date(2025, 1, 7),
+            completed_date=datetime.date(2025, 1, 7),
+            description=description,
+            amount=Decimal('-10.00'),
+            fee=Decimal('0'),
+            balance_after=Decimal('0'),
+            currency='PLN',
+            product='Current',
+            state='COMPLETED',
+            line_number=2,
+            counterparty_iban=counterparty_iban,
+        )
+        stmt = revolut.CsvStatementInfo(
+            filename='test.csv',
+            account_type='personal',
+            currency='PLN',
+            transactions=[txn],
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = revolut.RevolutSource(
+                directory=tmpdir,
+                account_map={'personal_PLN': 'Assets:Revolut:PLN'},
+                log_status=lambda x: None,
+            )
+        
+        entry = source._make_transaction(stmt, txn, 'Assets:Revolut:PLN')
+        
+        assert entry.payee == expected_payee